@@ -2,6 +2,8 @@
 GDB controller for managing GDB process and communication.
 """
 
+import codecs
+import os
 import subprocess
 import threading
 import queue
@@ -21,6 +23,20 @@ from .exceptions import (
 )
 
 
+# Per-line patterns of the output reader, compiled once
+# Tokenized MI record: token^result, token*async, token+async, token=async
+_MI_TOKEN_RE = re.compile(r'^(\d+)([\^*=+])(.*)$')
+_EXIT_REASON_RE = re.compile(r'reason="(exited|exit-normal|exited-normally|exited-signalled)"')
+_STOP_FILE_RE = re.compile(r'file="([^"]+)"')
+_STOP_LINE_RE = re.compile(r'line="(\d+)"')
+_STOP_FUNC_RE = re.compile(r'func="([^"]+)"')
+
+# Variable object replies: key="value" pairs and child={...} tuples, whose
+# quoted values may contain braces
+_MI_KEY_VALUE_RE = re.compile(r'([\w-]+)="((?:[^"\\]|\\.)*)"')
+_MI_CHILD_RE = re.compile(r'child=\{((?:[^{}"]|"(?:[^"\\]|\\.)*")*)\}')
+
+
 class GDBController(QObject):
     """
     Controller for managing GDB process and communication.
@@ -28,13 +44,17 @@ class GDBController(QObject):
 
     # Signals for UI updates
     state_changed = pyqtSignal(dict)
-    output_received = pyqtSignal(str)
+    output_received = pyqtSignal(str)  # Messages from the controller itself
+    output_batch_received = pyqtSignal(list)  # Lines read from GDB in one read
 
     def __init__(self):
         super().__init__()
         self.gdb_process = None
         self.output_queue = queue.Queue()
         self.read_thread = None
+        self.write_thread = None
+        self._write_queue = queue.SimpleQueue()  # Commands written by the write thread
+        self._stdin_lock = threading.Lock()  # Serialises writes to GDB's stdin
         self.current_state = {
             'state': 'disconnected',
             'file': None,
@@ -55,6 +75,10 @@ class GDBController(QObject):
         Returns:
             bool: True if GDB started successfully
         """
+        # A writer left over from a previous session must not pick up
+        # commands meant for the new process
+        self._stop_write_thread()
+
         try:
             # Start GDB process
             cmd = ['gdb', '--interpreter=mi2']
@@ -75,6 +99,13 @@ class GDBController(QObject):
             self.read_thread.daemon = True
             self.read_thread.start()
 
+            # Start command writing thread with its own queue for this process
+            self._write_queue = queue.SimpleQueue()
+            self.write_thread = threading.Thread(target=self._write_commands,
+                                                 args=(self.gdb_process, self._write_queue))
+            self.write_thread.daemon = True
+            self.write_thread.start()
+
             self.current_state['state'] = 'connected'
             self.state_changed.emit(self.current_state.copy())
             return True
@@ -87,16 +118,78 @@ class GDBController(QObject):
 
     def _read_output(self) -> None:
         """Read output from GDB process in a separate thread."""
+        # Read whatever GDB has written so far in one call, so a burst of
+        # output is handled and delivered to the UI as one batch
+        stdout_fd = self.gdb_process.stdout.fileno()
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        partial_line = ''
         while self.gdb_process and self.gdb_process.poll() is None:
             try:
-                line = self.gdb_process.stdout.readline()
-                if line:
-                    self.output_queue.put(line)
-                    self._process_output(line)
+                data = os.read(stdout_fd, 65536)
+                if not data:
+                    break
+                text = partial_line + decoder.decode(data).replace('\r\n', '\n')
             except (OSError, UnicodeDecodeError) as e:
                 self.output_received.emit(f"Error reading GDB output: {e}")
                 break
 
+            # Keep an incomplete last line for the next read
+            lines = text.split('\n')
+            partial_line = lines.pop()
+            if lines:
+                self._process_output_lines([line + '\n' for line in lines])
+
+    def _write_commands(self, process: subprocess.Popen, write_queue: queue.SimpleQueue) -> None:
+        """
+        Write queued commands to GDB in a separate thread until stopped with None.
+
+        Args:
+            process: GDB process the commands are written to
+            write_queue: Queue of commands for this process
+        """
+        running = True
+        while running:
+            # Commands queued while the previous write was in progress are
+            # written together, as one block of lines with a single flush
+            commands = [write_queue.get()]
+            while True:
+                try:
+                    commands.append(write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in commands:
+                commands = commands[:commands.index(None)]
+                running = False
+            if commands and process.poll() is None:
+                self._write_stdin(process, '\n'.join(commands))
+
+    def _stop_write_thread(self) -> None:
+        """Stop the write thread, dropping commands it has not written yet."""
+        if self.write_thread is None:
+            return
+
+        while True:
+            try:
+                self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+        self._write_queue.put(None)
+        if self.write_thread is not threading.current_thread():
+            self.write_thread.join(timeout=1)
+        self.write_thread = None
+
+    def _process_output_lines(self, lines: List[str]) -> None:
+        """
+        Process lines read from GDB and emit them as one batch.
+
+        Args:
+            lines: Complete output lines, each ending with a newline
+        """
+        for line in lines:
+            self.output_queue.put(line)
+            self._process_output(line)
+        self.output_batch_received.emit(lines)
+
     def _parse_mi_output(self, output: str) -> Optional[Tuple[Union[int, str], Optional[str], Optional[str]]]:
         """
         Parse GDB/MI output line.
@@ -118,8 +211,7 @@ class GDBController(QObject):
 
         # Check for tokenized response: token^result, token*async, etc.
         # Token is a number
-        import re
-        match = re.match(r'^(\d+)([\^*=+])(.*)$', output)
+        match = _MI_TOKEN_RE.match(output)
         if match:
             token = int(match.group(1))
             result_type = match.group(2)  # ^, *, +, =
@@ -130,9 +222,6 @@ class GDBController(QObject):
 
     def _process_output(self, output: str) -> None:
         """Process GDB output and update state accordingly."""
-        # Emit raw output
-        self.output_received.emit(output)
-
         # First, try to parse as MI response
         parsed = self._parse_mi_output(output)
         if parsed:
@@ -148,10 +237,8 @@ class GDBController(QObject):
         else:
             # Not a tokenized MI response, process for state changes
             # Check for exited first, as exited messages may also contain 'stopped'
-            import re
             # Check for various forms of exit messages
-            exit_pattern = r'reason="(exited|exit-normal|exited-normally|exited-signalled)"'
-            exit_match = re.search(exit_pattern, output)
+            exit_match = _EXIT_REASON_RE.search(output)
 
             if exit_match:
                 # Program has exited, clear line and file info
@@ -168,10 +255,8 @@ class GDBController(QObject):
 
     def _handle_stopped_state(self, output: str) -> None:
         """Handle stopped state and extract location information."""
-        import re
         # Check if this is actually an exit message
-        exit_pattern = r'reason="(exited|exit-normal|exited-normally|exited-signalled)"'
-        exit_match = re.search(exit_pattern, output)
+        exit_match = _EXIT_REASON_RE.search(output)
 
         if exit_match:
             # Program has exited, not stopped
@@ -184,9 +269,9 @@ class GDBController(QObject):
             self.current_state['state'] = 'stopped'
 
             # Extract file and line information
-            file_match = re.search(r'file="([^"]+)"', output)
-            line_match = re.search(r'line="(\d+)"', output)
-            func_match = re.search(r'func="([^"]+)"', output)
+            file_match = _STOP_FILE_RE.search(output)
+            line_match = _STOP_LINE_RE.search(output)
+            func_match = _STOP_FUNC_RE.search(output)
 
             if file_match:
                 self.current_state['file'] = file_match.group(1)
@@ -210,14 +295,50 @@ class GDBController(QObject):
         if not self.gdb_process or self.gdb_process.poll() is not None:
             return False
 
+        return self._write_stdin(self.gdb_process, command)
+
+    def _write_stdin(self, process: subprocess.Popen, text: str) -> bool:
+        """
+        Write text followed by a newline to the stdin of a GDB process.
+
+        The GUI thread, the worker thread and the write thread all send
+        commands, so each write and flush is done under one lock.
+
+        Args:
+            process: GDB process to write to
+            text: One or more commands separated by newlines
+
+        Returns:
+            bool: True if the text was written successfully
+        """
         try:
-            self.gdb_process.stdin.write(command + '\n')
-            self.gdb_process.stdin.flush()
+            with self._stdin_lock:
+                process.stdin.write(text + '\n')
+                process.stdin.flush()
             return True
         except (OSError, BrokenPipeError) as e:
             self.output_received.emit(f"Failed to send command: {e}")
             return False
 
+    def async_send(self, command: str) -> bool:
+        """
+        Queue a command to be written to GDB by the write thread.
+
+        Unlike send_command(), this never blocks the caller while GDB is
+        busy reading its input.
+
+        Args:
+            command: GDB command to execute
+
+        Returns:
+            bool: True if command was queued
+        """
+        if not self.gdb_process or self.gdb_process.poll() is not None:
+            return False
+
+        self._write_queue.put(command)
+        return True
+
     def run(self) -> bool:
         """Start program execution."""
         return self.send_command("-exec-run")
@@ -341,7 +462,6 @@ class GDBController(QObject):
 
         # Parse register names from response
         # Format: ^done,register-names=["eax","ebx",...]
-        import re
         match = re.search(r'register-names=\[([^\]]*)\]', content)
         if not match:
             return []
@@ -379,7 +499,6 @@ class GDBController(QObject):
 
         # Parse register values from response
         # Format: ^done,register-values=[{number="0",value="0x0"},...]
-        import re
         match = re.search(r'register-values=\[([^\]]*)\]', content)
         if not match:
             return []
@@ -408,7 +527,6 @@ class GDBController(QObject):
         Returns:
             List of variable dictionaries
         """
-        import re
 
         # Find variables array pattern
         # Need to handle types with brackets like "int [5]" which contain ']'
@@ -536,7 +654,6 @@ class GDBController(QObject):
 
         # Parse stack frames from MI response
         # Format: ^done,stack=[frame={level="0",addr="0x...",func="...",file="...",line="..."},...]
-        import re
         # Find stack array pattern
         match = re.search(r'stack=\[([^\]]*)\]', content)
         if not match:
@@ -583,13 +700,84 @@ class GDBController(QObject):
             return None
 
         # Parse value from response: ^done,value="..."
-        import re
         match = re.search(r'value="([^"]*)"', content)
         if not match:
             return None
 
         return match.group(1)
 
+    def create_variable_object(self, expression: str) -> Optional[Dict[str, str]]:
+        """
+        Create a GDB variable object for an expression in the current frame.
+
+        Variable objects give stable handles whose children can be listed
+        on demand, so aggregates are only expanded when the user asks.
+
+        Args:
+            expression: Expression to create the variable object for
+
+        Returns:
+            Dictionary with name, numchild, value and type, or None if creation failed
+        """
+        if not self.gdb_process or self.gdb_process.poll() is not None:
+            return None
+
+        try:
+            response = self.send_mi_command_sync(f"-var-create - * {expression}")
+            result_type, content = response
+            if result_type != '^' or not content.startswith('done'):
+                return None
+        except GDBError:
+            return None
+
+        # Parse variable object from response: ^done,name="var1",numchild="2",value="...",type="..."
+        varobj = dict(_MI_KEY_VALUE_RE.findall(content))
+        if 'name' not in varobj:
+            return None
+        return varobj
+
+    def list_variable_children(self, varobj_name: str) -> List[Dict[str, str]]:
+        """
+        List the direct children of a GDB variable object.
+
+        Args:
+            varobj_name: Name of the variable object (e.g. "var1" or "var1.field")
+
+        Returns:
+            List of child dictionaries with name, exp, numchild, value and type
+        """
+        if not self.gdb_process or self.gdb_process.poll() is not None:
+            return []
+
+        try:
+            response = self.send_mi_command_sync(f"-var-list-children --simple-values {varobj_name}")
+            result_type, content = response
+            if result_type != '^' or not content.startswith('done'):
+                return []
+        except GDBError:
+            return []
+
+        # Parse children from response
+        # Format: ^done,numchild="2",children=[child={name="var1.a",exp="a",numchild="0",value="1",type="int"},...]
+        children = []
+        for entry in _MI_CHILD_RE.findall(content):
+            child = dict(_MI_KEY_VALUE_RE.findall(entry))
+            if child:
+                children.append(child)
+        return children
+
+    def delete_variable_object(self, varobj_name: str) -> bool:
+        """
+        Delete a GDB variable object and all of its children.
+
+        Args:
+            varobj_name: Name of the variable object
+
+        Returns:
+            bool: True if the delete command was sent successfully
+        """
+        return self.send_command(f"-var-delete {varobj_name}")
+
     def read_memory(self, address: int, size: int = 256) -> Optional[bytes]:
         """
         Read memory from address.
@@ -614,7 +802,6 @@ class GDBController(QObject):
 
         # Parse memory data from response
         # Format: ^done,memory=[{addr="0x...",data=["0x00","0x01",...]},...]
-        import re
         match = re.search(r'data=\[([^\]]*)\]', content)
         if not match:
             return None
@@ -646,6 +833,7 @@ class GDBController(QObject):
                 self.gdb_process.kill()
             finally:
                 self.gdb_process = None
+                self._stop_write_thread()
 
         self.current_state['state'] = 'disconnected'
         self.state_changed.emit(self.current_state.copy())
@@ -656,6 +844,22 @@ class GDBController(QObject):
             self.token_counter += 1
             return self.token_counter
 
+    def send_mi_command(self, command: str) -> Optional[int]:
+        """
+        Queue MI command tagged with a unique token without waiting for the response.
+
+        Args:
+            command: MI command (without token)
+
+        Returns:
+            Token of the command, echoed at the start of GDB's response line,
+            or None if the command could not be queued
+        """
+        token = self._get_next_token()
+        if self.async_send(f"{token}{command}"):
+            return token
+        return None
+
     def send_mi_command_sync(self, command: str, timeout: float = 5.0) -> Optional[Tuple[str, str]]:
         """
         Send MI command synchronously and wait for response.
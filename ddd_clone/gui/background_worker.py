@@ -0,0 +1,67 @@
+"""
+Worker thread for calls that would block the GUI thread.
+"""
+
+from typing import Any, Callable
+from PyQt5.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+
+class BackgroundWorker(QObject):
+    """
+    Runs submitted calls on a background QThread.
+
+    Used for anything slow enough to stall the event loop: synchronous MI
+    queries that wait for GDB, cleaning large batches of GDB output and
+    file system searches. Results are delivered through the reply signal,
+    queued to the thread that connected to it.
+    """
+
+    # Signals for results: (request name, result) and (request name, error message)
+    reply = pyqtSignal(str, object)
+    failed = pyqtSignal(str, str)
+
+    # Queued to the worker thread by submit()
+    _call_requested = pyqtSignal(str, object, object)
+
+    def __init__(self):
+        super().__init__()
+        self._thread = QThread()
+        self._call_requested.connect(self._run_call)
+        self.moveToThread(self._thread)
+
+    def start(self) -> None:
+        """Start the worker thread if it is not running."""
+        if not self._thread.isRunning():
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker thread after the current call has finished."""
+        if self._thread.isRunning():
+            self._thread.quit()
+            self._thread.wait()
+
+    def is_running(self) -> bool:
+        """Return True if the worker thread is running."""
+        return self._thread.isRunning()
+
+    def submit(self, request: str, func: Callable[..., Any], *args: Any) -> None:
+        """
+        Queue a call to run on the worker thread.
+
+        Args:
+            request: Name identifying the request in the reply signal
+            func: Callable to run
+            *args: Arguments passed to func
+        """
+        self.start()
+        self._call_requested.emit(request, func, args)
+
+    @pyqtSlot(str, object, object)
+    def _run_call(self, request: str, func: Callable[..., Any], args: tuple) -> None:
+        """Run a queued call and emit its result."""
+        try:
+            result = func(*args)
+        except Exception as e:
+            self.failed.emit(request, str(e))
+        else:
+            self.reply.emit(request, result)
@@ -2,7 +2,10 @@
 Breakpoint and watchpoint manager for handling breakpoints and watchpoints in the debugger.
 """
 
-from typing import Dict, List, Optional, Union
+import json
+import os
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, Union
 from PyQt5.QtCore import QObject, pyqtSignal
 
 
@@ -72,14 +75,38 @@ class BreakpointManager(QObject):
     watchpoint_added = pyqtSignal(Watchpoint)
     watchpoint_removed = pyqtSignal(int)  # watchpoint_id
     watchpoint_updated = pyqtSignal(Watchpoint)
+    bulk_changed = pyqtSignal()  # Emitted once when the outermost bulk() block exits
 
     def __init__(self, gdb_controller):
         super().__init__()
         self.gdb_controller = gdb_controller
         self.breakpoints: Dict[int, Breakpoint] = {}
+        # Breakpoints by (file, line), kept in step with self.breakpoints
+        self._breakpoints_by_location: Dict[Tuple[str, int], Breakpoint] = {}
         self.watchpoints: Dict[int, Watchpoint] = {}
         self.next_breakpoint_id = 1
         self.next_watchpoint_id = 1
+        self._bulk_depth = 0
+
+    @contextmanager
+    def bulk(self):
+        """
+        Group many changes into one bulk change.
+
+        Per-item signals are still emitted inside the block; listeners can
+        skip them while in_bulk() is True and refresh once on bulk_changed.
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                self.bulk_changed.emit()
+
+    def in_bulk(self) -> bool:
+        """Return True while changes are made inside a bulk() block."""
+        return self._bulk_depth > 0
 
     def add_breakpoint(self, file: str, line: int, condition: Optional[str] = None) -> Optional[Breakpoint]:
         """
@@ -94,7 +121,7 @@ class BreakpointManager(QObject):
             Breakpoint object if successful, None otherwise
         """
         # Check if breakpoint already exists at this location
-        existing_bp = self._find_breakpoint(file, line)
+        existing_bp = self.get_breakpoint_at(file, line)
         if existing_bp:
             return existing_bp
 
@@ -106,7 +133,7 @@ class BreakpointManager(QObject):
 
         # Set breakpoint in GDB
         if self.gdb_controller.set_breakpoint(file, line, condition):
-            self.breakpoints[breakpoint_id] = breakpoint
+            self._store_breakpoint(breakpoint)
             self.breakpoint_added.emit(breakpoint)
             return breakpoint
         else:
@@ -128,7 +155,8 @@ class BreakpointManager(QObject):
 
         # Remove breakpoint from GDB
         if self.gdb_controller.delete_breakpoint(breakpoint_id):
-            del self.breakpoints[breakpoint_id]
+            breakpoint = self.breakpoints.pop(breakpoint_id)
+            self._breakpoints_by_location.pop((breakpoint.file, breakpoint.line), None)
             self.breakpoint_removed.emit(breakpoint_id)
             return True
 
@@ -233,9 +261,9 @@ class BreakpointManager(QObject):
         for breakpoint_id in list(self.breakpoints.keys()):
             self.remove_breakpoint(breakpoint_id)
 
-    def _find_breakpoint(self, file: str, line: int) -> Optional[Breakpoint]:
+    def get_breakpoint_at(self, file: str, line: int) -> Optional[Breakpoint]:
         """
-        Find breakpoint at specific file and line.
+        Get the breakpoint at a specific file and line.
 
         Args:
             file: Source file path
@@ -244,10 +272,15 @@ class BreakpointManager(QObject):
         Returns:
             Breakpoint object if found, None otherwise
         """
-        for breakpoint in self.breakpoints.values():
-            if breakpoint.file == file and breakpoint.line == line:
-                return breakpoint
-        return None
+        return self._breakpoints_by_location.get((file, line))
+
+    def _store_breakpoint(self, breakpoint: Breakpoint) -> None:
+        """Record a breakpoint by ID and by location, replacing one with the same ID."""
+        previous = self.breakpoints.get(breakpoint.breakpoint_id)
+        if previous is not None:
+            self._breakpoints_by_location.pop((previous.file, previous.line), None)
+        self.breakpoints[breakpoint.breakpoint_id] = breakpoint
+        self._breakpoints_by_location[(breakpoint.file, breakpoint.line)] = breakpoint
 
     def sync_with_gdb(self):
         """
@@ -269,66 +302,65 @@ class BreakpointManager(QObject):
             True if successful, False otherwise
         """
         try:
-            import json
-            import os
-
             if not os.path.exists(file_path):
                 return False
 
             with open(file_path, 'r') as f:
                 data = json.load(f)
 
-            # Clear existing breakpoints and watchpoints
-            self.clear_all_breakpoints()
-            self.clear_all_watchpoints()
-
-            # Load breakpoints
-            for bp_data in data.get('breakpoints', []):
-                bp_id = bp_data.get('id')
-                file = bp_data.get('file')
-                line = bp_data.get('line')
-                condition = bp_data.get('condition')
-                enabled = bp_data.get('enabled', True)
-
-                # Create breakpoint
-                bp = Breakpoint(bp_id, file, line, condition)
-                bp.enabled = enabled
-                self.breakpoints[bp_id] = bp
-
-                # Set in GDB if enabled
-                if enabled and self.gdb_controller:
-                    self.gdb_controller.set_breakpoint(file, line, condition)
-
-            # Update next breakpoint ID
-            if self.breakpoints:
-                self.next_breakpoint_id = max(self.breakpoints.keys()) + 1
-
-            # Load watchpoints
-            for wp_data in data.get('watchpoints', []):
-                wp_id = wp_data.get('id')
-                expression = wp_data.get('expression')
-                watch_type = wp_data.get('type', 'write')  # Note: 'type' key from to_dict()
-                enabled = wp_data.get('enabled', True)
-
-                # Create watchpoint
-                wp = Watchpoint(wp_id, expression, watch_type)
-                wp.enabled = enabled
-                self.watchpoints[wp_id] = wp
-
-                # Set in GDB if enabled
-                if enabled and self.gdb_controller:
-                    self.gdb_controller.set_watchpoint(expression, watch_type)
-
-            # Update next watchpoint ID
-            if self.watchpoints:
-                self.next_watchpoint_id = max(self.watchpoints.keys()) + 1
-
-            # Emit signals for UI updates
-            for bp in self.breakpoints.values():
-                self.breakpoint_added.emit(bp)
-
-            for wp in self.watchpoints.values():
-                self.watchpoint_added.emit(wp)
+            # Apply everything as one bulk change so views refresh once
+            with self.bulk():
+                # Clear existing breakpoints and watchpoints
+                self.clear_all_breakpoints()
+                self.clear_all_watchpoints()
+
+                # Load breakpoints
+                for bp_data in data.get('breakpoints', []):
+                    bp_id = bp_data.get('id')
+                    file = bp_data.get('file')
+                    line = bp_data.get('line')
+                    condition = bp_data.get('condition')
+                    enabled = bp_data.get('enabled', True)
+
+                    # Create breakpoint
+                    bp = Breakpoint(bp_id, file, line, condition)
+                    bp.enabled = enabled
+                    self._store_breakpoint(bp)
+
+                    # Set in GDB if enabled
+                    if enabled and self.gdb_controller:
+                        self.gdb_controller.set_breakpoint(file, line, condition)
+
+                # Update next breakpoint ID
+                if self.breakpoints:
+                    self.next_breakpoint_id = max(self.breakpoints.keys()) + 1
+
+                # Load watchpoints
+                for wp_data in data.get('watchpoints', []):
+                    wp_id = wp_data.get('id')
+                    expression = wp_data.get('expression')
+                    watch_type = wp_data.get('type', 'write')  # Note: 'type' key from to_dict()
+                    enabled = wp_data.get('enabled', True)
+
+                    # Create watchpoint
+                    wp = Watchpoint(wp_id, expression, watch_type)
+                    wp.enabled = enabled
+                    self.watchpoints[wp_id] = wp
+
+                    # Set in GDB if enabled
+                    if enabled and self.gdb_controller:
+                        self.gdb_controller.set_watchpoint(expression, watch_type)
+
+                # Update next watchpoint ID
+                if self.watchpoints:
+                    self.next_watchpoint_id = max(self.watchpoints.keys()) + 1
+
+                # Emit signals for UI updates
+                for bp in self.breakpoints.values():
+                    self.breakpoint_added.emit(bp)
+
+                for wp in self.watchpoints.values():
+                    self.watchpoint_added.emit(wp)
 
             return True
         except Exception as e:
@@ -345,9 +377,6 @@ class BreakpointManager(QObject):
             True if successful, False otherwise
         """
         try:
-            import json
-            import os
-
             # Prepare data structure
             data = {
                 'breakpoints': [bp.to_dict() for bp in self.breakpoints.values()],
@@ -0,0 +1,291 @@
+"""
+Item model for the debug information views (variables, watch, breakpoints, call stack).
+"""
+
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex, QSize
+from PyQt5.QtGui import QBrush
+from PyQt5.QtWidgets import QStyledItemDelegate
+
+
+# Text shown in the placeholder row while children are being loaded
+LOADING_TEXT = "Loading..."
+
+# A loaded child: (column strings, user data, has lazily loaded children)
+ChildRow = Tuple[Sequence[str], Any, bool]
+
+# Loads the children of a row: called with the row's user data and a
+# callback that receives the loaded children, possibly later
+ChildrenLoader = Callable[[Any, Callable[[List[ChildRow]], None]], None]
+
+
+class TreeNode:
+    """
+    A single row in a DebugTreeModel.
+    """
+
+    __slots__ = ('values', 'data', 'parent', 'row', 'children', 'expandable', 'fetched', 'highlighted')
+
+    def __init__(self, values: Sequence[str], data: Any = None,
+                 parent: Optional['TreeNode'] = None, expandable: bool = False,
+                 highlighted: bool = False, row: int = 0):
+        self.values = tuple(values)
+        self.data = data
+        self.parent = parent
+        self.row = row  # Row within the parent, fixed once the node is inserted
+        self.children: List['TreeNode'] = []
+        self.expandable = expandable  # Children exist but are loaded on demand
+        self.fetched = False
+        self.highlighted = highlighted  # Highlight column is painted with the highlight brush
+
+
+class DebugTreeModel(QAbstractItemModel):
+    """
+    Tree item model backing a QTreeView.
+
+    Top-level rows are swapped in with a single model reset, so the attached
+    view lays out and paints only the rows that are visible. Rows marked as
+    expandable report children without loading them; the children are
+    requested from the children loader the first time the row is expanded.
+    """
+
+    def __init__(self, headers: Sequence[str], parent=None):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self._root = TreeNode(())
+        self._children_loader: Optional[ChildrenLoader] = None
+        # Bumped on every reset so deferred loads for discarded rows are dropped
+        self._generation = 0
+        # Background of the highlight column in highlighted rows
+        self._highlight_column = -1
+        self._highlight_brush: Optional[QBrush] = None
+
+    def set_highlight(self, column: int, brush: QBrush) -> None:
+        """
+        Set how highlighted rows are painted.
+
+        Args:
+            column: Column whose background is painted in highlighted rows
+            brush: Background brush of the highlighted cells
+        """
+        self._highlight_column = column
+        self._highlight_brush = brush
+
+    def set_children_loader(self, loader: Optional[ChildrenLoader]) -> None:
+        """
+        Set the callable used to load children of expandable rows.
+
+        Args:
+            loader: Callable taking a row's user data and a callback; the
+                callback is called, now or later, with a list of
+                (column strings, user data, expandable) tuples
+        """
+        self._children_loader = loader
+
+    def _node(self, index: QModelIndex) -> TreeNode:
+        """Return the node for an index (the root for an invalid index)."""
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Return the index of the item at row and column under parent."""
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self._node(parent).children[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Return the parent index of an item."""
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self._root:
+            return QModelIndex()
+        return self.createIndex(parent_node.row, 0, parent_node)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of loaded rows under parent."""
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of columns."""
+        return len(self.headers)
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Report children for expandable rows without loading them."""
+        node = self._node(parent)
+        if node.expandable and not node.fetched:
+            return True
+        return bool(node.children)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Return True if the row has children that were not loaded yet."""
+        node = self._node(parent)
+        return node.expandable and not node.fetched and self._children_loader is not None
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """
+        Start loading the children of a row.
+
+        A placeholder row is inserted immediately and replaced when the
+        loader delivers the children, so the loader may answer asynchronously.
+        """
+        node = self._node(parent)
+        if not self.canFetchMore(parent):
+            return
+        node.fetched = True
+
+        self.beginInsertRows(parent, 0, 0)
+        node.children.append(TreeNode((LOADING_TEXT,), parent=node))
+        self.endInsertRows()
+
+        generation = self._generation
+        self._children_loader(node.data,
+                              lambda children: self._insert_children(node, generation, children))
+
+    def _insert_children(self, node: TreeNode, generation: int, children: List[ChildRow]) -> None:
+        """Replace the placeholder row of a node with its loaded children."""
+        if generation != self._generation:
+            return  # Model was reset, node is no longer shown
+
+        parent = self.createIndex(node.row, 0, node)
+
+        self.beginRemoveRows(parent, 0, len(node.children) - 1)
+        node.children = []
+        self.endRemoveRows()
+
+        if children:
+            self.beginInsertRows(parent, 0, len(children) - 1)
+            node.children = [TreeNode(values, data, node, expandable, row=row)
+                             for row, (values, data, expandable) in enumerate(children)]
+            self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Return the display text or the user data stored for a row."""
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            column = index.column()
+            return node.values[column] if column < len(node.values) else ""
+        if role == Qt.UserRole:
+            return node.data
+        if role == Qt.BackgroundRole and node.highlighted and index.column() == self._highlight_column:
+            return self._highlight_brush
+        return None
+
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole) -> Any:
+        """Return the header label for a column."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.headers):
+            return self.headers[section]
+        return None
+
+    def set_rows(self, rows: Sequence[Sequence[str]], row_data: Optional[Sequence[Any]] = None,
+                 expandable: Optional[Sequence[bool]] = None,
+                 highlighted: Optional[Sequence[bool]] = None) -> None:
+        """
+        Replace all top-level rows with a single model reset.
+
+        Args:
+            rows: Sequence of rows, each a sequence of column strings
+            row_data: Optional per-row user data (returned for Qt.UserRole)
+            expandable: Optional per-row flags marking rows with lazily loaded children
+            highlighted: Optional per-row flags marking rows painted with the highlight brush
+        """
+        if row_data is None:
+            row_data = [None] * len(rows)
+        if expandable is None:
+            expandable = [False] * len(rows)
+        if highlighted is None:
+            highlighted = [False] * len(rows)
+
+        self.beginResetModel()
+        self._generation += 1
+        root = self._root
+        root.children = [TreeNode(values, data, root, can_expand, is_highlighted, row)
+                         for row, (values, data, can_expand, is_highlighted)
+                         in enumerate(zip(rows, row_data, expandable, highlighted))]
+        self.endResetModel()
+
+    def update_rows(self, rows: Sequence[Sequence[str]],
+                    highlighted: Optional[Sequence[bool]] = None) -> bool:
+        """
+        Update the values of flat top-level rows in place.
+
+        Only rows whose values or highlight changed are reported with
+        dataChanged, so the view repaints just those rows. User data is kept.
+
+        Args:
+            rows: Sequence of rows, each a sequence of column strings
+            highlighted: Optional per-row flags marking rows painted with the highlight brush
+
+        Returns:
+            bool: True if the rows were updated, False if the number of rows
+                differs (nothing is changed then; use set_rows)
+        """
+        nodes = self._root.children
+        if len(rows) != len(nodes):
+            return False
+        if highlighted is None:
+            highlighted = [False] * len(rows)
+
+        last_column = len(self.headers) - 1
+        for row, (node, values, is_highlighted) in enumerate(zip(nodes, rows, highlighted)):
+            values = tuple(values)
+            if node.values != values or node.highlighted != is_highlighted:
+                node.values = values
+                node.highlighted = is_highlighted
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+        return True
+
+    def append_row(self, row: Sequence[str], row_data: Any = None, expandable: bool = False) -> None:
+        """
+        Append a single top-level row.
+
+        Args:
+            row: Column strings for the new row
+            row_data: Optional user data for the row
+            expandable: True if the row has lazily loaded children
+        """
+        position = len(self._root.children)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._root.children.append(TreeNode(row, row_data, self._root, expandable, row=position))
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.set_rows([])
+
+    def row_values(self, row: int) -> tuple:
+        """
+        Get the column strings of a top-level row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            Tuple of column strings
+        """
+        return self._root.children[row].values
+
+
+class FixedRowDelegate(QStyledItemDelegate):
+    """
+    Item delegate that gives every row the same height.
+
+    The height is measured from the first item the view asks about and
+    reused for all others, so rows are never measured one by one. Columns
+    are sized interactively, so no width is reported.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._row_height = -1
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        """Return the size hint shared by all rows."""
+        if self._row_height < 0:
+            self._row_height = super().sizeHint(option, index).height()
+        return QSize(-1, self._row_height)
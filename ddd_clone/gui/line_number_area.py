@@ -2,9 +2,11 @@
 Line number area for source viewer.
 """
 
-from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import Qt, QRect, QPoint, pyqtSignal
-from PyQt5.QtGui import QPainter, QFont, QColor, QBrush, QMouseEvent, QTextCursor, QPen, QPainterPath
+from PyQt5.QtWidgets import QWidget, QTextEdit
+from PyQt5.QtCore import Qt, QRect, QPoint, QPointF, pyqtSignal
+from PyQt5.QtGui import (
+    QPainter, QFont, QColor, QBrush, QMouseEvent, QTextCursor, QPen, QPainterPath, QStaticText
+)
 
 
 class LineNumberArea(QWidget):
@@ -18,10 +20,85 @@ class LineNumberArea(QWidget):
     def __init__(self, source_viewer):
         super().__init__(source_viewer)
         self.source_viewer = source_viewer
-        self.setFont(QFont("Courier New", 18))  # Larger font
         self.arrow_area_width = 30  # Width for debug arrow area
+        # Paint styles are created once and reused by every paintEvent
+        self._bg_color = QColor(202, 234, 206)  # Bean green, same as source viewer
+        self._arrow_color = QColor(0, 150, 0)  # Dark green
+        self._bp_brush = QBrush(QColor(255, 0, 0, 64))  # Semi-transparent red fill
+        self._bp_pen = QPen(QColor(255, 0, 0))  # Solid red border
+        self._text_pen = QPen(Qt.black)
+        self._separator_pen = QPen(QColor(180, 180, 180), 1)  # Light gray, 1px wide solid line
+        # Cached block height and top-to-top stride, valid while all lines share one height
+        self._fixed_line_height = None
+        self._fixed_line_stride = None
+        self._line_metrics_valid = False
+        # Line number strings indexed by 1-based line number (index 0 is padding)
+        self._line_strings = [""]
+        # Laid-out line number texts and their pixel widths, valid for the current font
+        self._static_texts = {}
+        # Font of the debug arrow, valid for the current font and line height
+        self._arrow_font = None
+        self.setFont(QFont("Courier New", 18))  # Larger font
         # Connect to current line changes to update arrow
         self.source_viewer.current_line_changed.connect(self.update)
+        # Any content change (new file, reformatting) may change line heights
+        self.source_viewer.document().contentsChanged.connect(self.invalidate_line_metrics)
+
+    def invalidate_line_metrics(self):
+        """Drop the cached line height so it is measured again on next paint."""
+        self._line_metrics_valid = False
+
+    def _update_line_metrics(self):
+        """
+        Measure the fixed line height and stride of the source document.
+
+        In NoWrap mode every block is a single line of the same font, so the
+        height of the first block and the distance to the second block apply
+        to the whole document. Otherwise both values stay None and the paint
+        loop falls back to querying each block's bounding rect.
+        """
+        self._fixed_line_height = None
+        self._fixed_line_stride = None
+        self._line_metrics_valid = True
+
+        if self.source_viewer.lineWrapMode() != QTextEdit.NoWrap:
+            return
+
+        first_block = self.source_viewer.document().firstBlock()
+        first_rect = self.source_viewer.blockBoundingGeometry(first_block)
+        if first_rect.isNull():
+            return
+
+        self._fixed_line_height = first_rect.height()
+        second_block = first_block.next()
+        if second_block.isValid():
+            second_rect = self.source_viewer.blockBoundingGeometry(second_block)
+            self._fixed_line_stride = second_rect.top() - first_rect.top()
+        else:
+            self._fixed_line_stride = first_rect.height()
+
+    def _num_str(self, line_number: int) -> str:
+        """Return the cached display string for a 1-based line number."""
+        line_strings = self._line_strings
+        while len(line_strings) <= line_number:
+            line_strings.append(str(len(line_strings)))
+        return line_strings[line_number]
+
+    def _static_text(self, number: str):
+        """
+        Return a cached QStaticText, its advance and its layout width for a line number string.
+
+        The text is laid out once per font, so painting a line number only
+        translates an existing layout instead of shaping the string again.
+        """
+        entry = self._static_texts.get(number)
+        if entry is None:
+            static_text = QStaticText(number)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.prepare(font=self.font())
+            entry = (static_text, self.fontMetrics().horizontalAdvance(number), static_text.size().width())
+            self._static_texts[number] = entry
+        return entry
 
     def set_font(self, font):
         """Set font for line number area and trigger repaint."""
@@ -71,14 +148,15 @@ class LineNumberArea(QWidget):
 
     def paintEvent(self, event):
         """Paint the line numbers and breakpoint markers."""
-        # Debug: print paint event information
-        # print(f"LineNumberArea paintEvent: event.rect={event.rect()}, self.rect={self.rect()}")
+        # Skip spurious dispatches (collapsed splitter, layout not finished yet)
+        if event.rect().isEmpty() or self.width() <= 0 or not self.isVisible():
+            return
 
         painter = QPainter(self)
         # Explicitly set the painter font to ensure it uses our font
         painter.setFont(self.font())
         # Fill the update region background (use event.rect() as in the working version)
-        painter.fillRect(event.rect(), QColor(202, 234, 206))
+        painter.fillRect(event.rect(), self._bg_color)
 
         block = self.source_viewer.firstVisibleBlock()
         if not block.isValid():
@@ -86,35 +164,63 @@ class LineNumberArea(QWidget):
 
         block_number = block.blockNumber()
 
-        while block.isValid():
-            # Get block rectangle in viewport coordinates
-            block_rect = self.source_viewer.blockBoundingRect(block)
-            if block_rect.isNull():
-                break
-
-            top = block_rect.top()
-            bottom = top + block_rect.height()
+        if not self._line_metrics_valid:
+            self._update_line_metrics()
+        fixed_height = self._fixed_line_height
+        fixed_stride = self._fixed_line_stride
 
-            # Debug: print block information (only first few)
-            # if block_number < 3:
-            #     print(f"Block {block_number}: top={top}, bottom={bottom}, height={block_rect.height()}")
+        # Only the first block needs a layout query when line heights are uniform
+        block_rect = self.source_viewer.blockBoundingRect(block)
+        if block_rect.isNull():
+            return
+        top = block_rect.top()
+
+        breakpoint_lines = self.source_viewer.breakpoint_lines
+        # Track painter state so pen and brush are only changed on transitions;
+        # runs of plain line numbers then issue no state changes at all
+        active_pen = None
+        bp_brush_set = False
+        # Right edge shared by line numbers and breakpoint boxes
+        number_right = self.width() - 10
+        update_rect = event.rect()
+        update_top = update_rect.top()
+        update_bottom = update_rect.bottom()
+        text_height = painter.fontMetrics().height()
 
-            # Check if block is visible in line number area
-            if block.isVisible() and top <= event.rect().bottom() and bottom >= event.rect().top():
+        while block.isValid():
+            if fixed_height is not None:
+                block_height_f = fixed_height
+            else:
+                # Get block rectangle in viewport coordinates
+                block_rect = self.source_viewer.blockBoundingRect(block)
+                if block_rect.isNull():
+                    break
+                top = block_rect.top()
+                block_height_f = block_rect.height()
+
+            bottom = top + block_height_f
+
+            # Check if block is inside the update region.
+            # The source viewer never hides blocks (there is no code folding), so
+            # block.isVisible() is not checked here. A folding feature must add that
+            # guard back and disable the fixed stride, since hidden blocks have no height.
+            if top <= update_bottom and bottom >= update_top:
                 line_number = block_number + 1
 
                 # Calculate block height for vertical alignment
-                block_height = int(block_rect.height())
+                block_height = int(block_height_f)
 
                 # Draw debug arrow for current line
                 if hasattr(self.source_viewer, 'current_line') and line_number == self.source_viewer.current_line:
                     # Draw dark green Unicode arrow (U+2794) in leftmost area
                     arrow_char = "\u2794"  # HEAVY ROUND-TIPPED RIGHTWARDS ARROW
 
-                    # Create a smaller font for the arrow
-                    arrow_font = QFont(self.font())
+                    # Arrow font scaled to the line height, created once per size
                     arrow_font_size = max(12, block_height * 3 // 4)  # Adjust size based on line height, increased by 50%
-                    arrow_font.setPointSize(arrow_font_size)
+                    arrow_font = self._arrow_font
+                    if arrow_font is None or arrow_font.pointSize() != arrow_font_size:
+                        arrow_font = self._arrow_font = QFont(self.font())
+                        arrow_font.setPointSize(arrow_font_size)
 
                     # Calculate position for centered arrow
                     arrow_rect = QRect(0, int(top), self.arrow_area_width, block_height)
@@ -122,38 +228,42 @@ class LineNumberArea(QWidget):
                     # Draw arrow character
                     painter.save()
                     painter.setFont(arrow_font)
-                    painter.setPen(QColor(0, 150, 0))  # Dark green
+                    painter.setPen(self._arrow_color)
                     painter.drawText(arrow_rect, Qt.AlignCenter, arrow_char)
                     painter.restore()
 
+                number_text, text_width, layout_width = self._static_text(self._num_str(line_number))
+
                 # Draw breakpoint marker if this line has a breakpoint
-                if line_number in self.source_viewer.breakpoint_lines:
+                if breakpoint_lines and line_number in breakpoint_lines:
                     # Draw transparent red box around line number
-                    # Calculate text width for proper box sizing
-                    number_text = str(line_number)
-                    text_width = painter.fontMetrics().horizontalAdvance(number_text)
                     # Box dimensions with padding
                     box_padding = 4
                     box_width = text_width + box_padding * 2
                     box_height = block_height - 2  # Slightly smaller than line height
                     # Position box to align with right-aligned line numbers
-                    box_right = self.width() - 10  # Same right edge as line numbers
+                    box_right = number_right  # Same right edge as line numbers
                     box_left = box_right - box_width
                     box_top = int(top) + 1
 
                     # Draw semi-transparent red box
-                    painter.setBrush(QBrush(QColor(255, 0, 0, 64)))  # Semi-transparent red fill
-                    painter.setPen(QColor(255, 0, 0))  # Solid red border
+                    if not bp_brush_set:
+                        painter.setBrush(self._bp_brush)
+                        bp_brush_set = True
+                    if active_pen is not self._bp_pen:
+                        painter.setPen(self._bp_pen)
+                        active_pen = self._bp_pen
                     painter.drawRect(box_left, box_top, box_width, box_height)
 
-                # Draw line number
-                number = str(line_number)
-                painter.setPen(Qt.black)
-                rect = QRect(self.arrow_area_width, int(top), self.width() - 10 - self.arrow_area_width, block_height)
-                painter.drawText(rect, Qt.AlignRight | Qt.AlignVCenter, number)
+                # Draw line number right-aligned and vertically centered in the block
+                if active_pen is not self._text_pen:
+                    painter.setPen(self._text_pen)
+                    active_pen = self._text_pen
+                text_top = int(top) + (block_height - text_height) / 2
+                painter.drawStaticText(QPointF(number_right - layout_width, text_top), number_text)
 
             # If block is below the visible area, stop (blocks are sorted)
-            if top > event.rect().bottom():
+            if top > update_bottom:
                 break
 
             # Move to next block
@@ -161,14 +271,19 @@ class LineNumberArea(QWidget):
             if not block.isValid():
                 break
             block_number += 1
+            if fixed_stride is not None:
+                top += fixed_stride
 
         # Draw vertical separator line between line numbers and code
-        painter.setPen(QPen(QColor(180, 180, 180), 1))  # Light gray, 1px wide solid line
+        painter.setPen(self._separator_pen)
         line_x = self.width() - 1  # Right edge of line number area
         painter.drawLine(line_x, 0, line_x, self.height())
 
     def changeEvent(self, event):
         """Handle change events, including font changes."""
         if event.type() == event.FontChange:
+            self.invalidate_line_metrics()
+            self._static_texts.clear()
+            self._arrow_font = None
             self.update()
         super().changeEvent(event)
\ No newline at end of file
@@ -3,21 +3,489 @@ Main application window for DDD Clone.
 """
 
 import os
-from typing import Any
+import re
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QTabWidget, QTextEdit, QTreeWidget, QTreeWidgetItem, QToolBar,
+    QTabWidget, QPlainTextEdit, QTreeView, QToolBar,
     QAction, QStatusBar, QLabel, QMessageBox, QMenuBar, QMenu, QFileDialog,
     QLineEdit, QPushButton, QHBoxLayout, QToolTip, QDialog, QComboBox,
-    QSpacerItem, QSizePolicy, QToolButton
+    QSpacerItem, QSizePolicy, QToolButton, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QIcon, QFont
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtGui import QIcon, QFont, QTextCursor, QBrush
 
 from ..gdb.gdb_controller import GDBController
-from .source_viewer import SourceViewer
+from .source_viewer import SourceViewer, is_variable_name
 from .breakpoint_manager import BreakpointManager
 from .variable_inspector import VariableInspector
+from .debug_tree_model import DebugTreeModel, FixedRowDelegate
+from .background_worker import BackgroundWorker
+
+
+# Noise in the GDB console that is not shown in the output pane (case-insensitive)
+_NOISE_PATTERNS = [
+    r'GNU gdb.*',
+    r'Copyright.*',
+    r'License GPL.*',
+    r'This is free software.*',
+    r'There is NO WARRANTY.*',
+    r'Type.*show copying.*',
+    r'Type.*show warranty.*',
+    r'This GDB was configured as.*',
+    r'Type.*show configuration.*',
+    r'For bug reporting instructions.*',
+    r'Find the GDB manual.*',
+    r'For help, type.*',
+    r'Type.*apropos word.*',
+    r'\s*$',  # Empty or whitespace-only lines
+    # URLs related to GDB documentation and bug reporting
+    r'<https?://.*gnu\.org/software/gdb.*>.*',
+    r'<https?://www\.gnu\.org/software/gdb.*>.*',
+    # General GDB info URLs
+    r'<https?://.*gnu\.org/licenses/.*>.*',
+    # Lines that are just URLs in angle brackets
+    r'<[^>]*>\s*\.?$',
+    # Incomplete lines from split output
+    r'Type\s*".*',
+    r'show copying.*',
+    r'<".*',
+    r'.*gnu\.org/software/gdb.*',
+    r'".*',  # Lines that start with a quote
+    # GDB/MI asynchronous notifications (technical details)
+    r'\*?running,thread-id=.*',
+    r'\*?stopped,reason=.*',
+    r'\*?breakpoint-hit,.*',
+    r'\*?thread-created,.*',
+    r'\*?thread-exited,.*',
+    r'\*?library-loaded,.*',
+    r'\*?library-unloaded,.*',
+    # GDB/MI status messages with technical parameters
+    r'.*thread-id="\d+".*',
+    r'.*frame=\{.*',
+    r'.*stopped-threads=.*',
+    r'.*arch=".*".*',
+    # Lines that are just punctuation or very short noise
+    r'[\s\"\'\\]*$',
+    # GDB command echo (e.g., "p sum", "print fib_result")
+    r'(p|print|break|watch|display|info|run|continue|next|step|finish|kill|quit)\s+',
+    # Lines that contain command prompts but no actual output
+    r'\(\w+\)\s*$',
+    # GDB help and info lines that may be split across multiple lines
+    r'show\s+\w+.*',
+    r'.*for details.*',
+    r'.*for configuration details.*',
+    r'.*to search for commands.*',
+    # MI command responses (e.g., "1^done,register-names=...")
+    r'\d+\^(?-i:done|error),.*',
+    # GDB status messages (breakpoint hits and source lines are kept)
+    r'(?-i:Reading symbols from).*',
+    r'(?-i:\[New Thread).*\]',
+    # Type "" or Type "?"
+    r'(?-i:Type)\s*"?"?$',
+]
+
+# All noise patterns as one alternation so each line is matched once
+_NOISE_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _NOISE_PATTERNS), re.IGNORECASE)
+
+# Literal starts of noise lines (banner, symbol loading, split quotes); these
+# lines are noise without running the alternation
+_NOISE_PREFIXES = ('GNU gdb', 'Copyright', 'License GPL', 'This is free software',
+                   'There is NO WARRANTY', 'This GDB was configured as',
+                   'For bug reporting instructions', 'Find the GDB manual', 'For help, type',
+                   'Reading symbols from', '"')
+
+# Very short lines made of punctuation and quotes only
+_SHORT_PUNCTUATION_RE = re.compile(r'^[\s\"\'\\\.\?]*$')
+
+# Escape sequences unescaped in console and log stream records; other
+# sequences (e.g. \t) are kept as written
+_STREAM_ESCAPE_RE = re.compile(r'\\(.)')
+_STREAM_ESCAPES = {'n': '\n', '"': '"', '\\': '\\'}
+
+# Source code line quoted by GDB, e.g. "5\tint x = 0;"
+_SRC_LINE_RE = re.compile(r'"(\d+\\t.*?)"')
+
+# Value history output, e.g. $1 = 5
+_VARIABLE_OUTPUT_RE = re.compile(r'^\$\d+\s*=')
+_VARIABLE_VALUE_RE = re.compile(r'^(\$\d+\s*=\s*)([\'"]?)(.*?)\2$')
+
+# Error message of an MI ^error record
+_MI_ERROR_MSG_RE = re.compile(r'msg="([^"]+)"')
+
+# 7-bit C1 ANSI sequences
+_ANSI_RE = re.compile(r'''
+    \x1B  # ESC
+    (?:   # 7-bit C1 Fe (except CSI)
+        [@-Z\\-_]
+    |     # or [ for CSI, followed by a control sequence
+        \[
+        [0-?]*  # Parameter bytes
+        [ -/]*  # Intermediate bytes
+        [@-~]   # Final byte
+    )
+''', re.VERBOSE)
+
+# Number of lines kept in the GDB output pane
+_GDB_OUTPUT_MAX_LINES = 10000
+
+# Number of hovered variable values kept for the current stop
+_HOVER_CACHE_SIZE = 256
+
+# Register format combo entries -> register_format letters
+_REGISTER_FORMATS = {
+    "Hex": "x",
+    "Decimal": "d",
+    "Octal": "o",
+    "Binary": "b",
+}
+
+# register_format letters that differ from the -data-list-register-values
+# format letters (GDB uses "t" for binary and rejects "b")
+_MI_REGISTER_FORMATS = {"b": "t"}
+
+# Time the program must stay stopped before hovered variables are queried,
+# so stepping quickly past identifiers under the mouse sends no queries
+_STABLE_STOP_MS = 250
+
+# Time an execution error stays in the status bar
+_ERROR_MESSAGE_MS = 5000
+
+# Breakpoint creation or hit, matched in one scan:
+# "Breakpoint 1 at 0x401530: file simple_program.c, line 5." (groups 2, 3)
+# "Breakpoint 1, main () at simple_program.c:5" (groups 4, 5)
+_BREAKPOINT_RE = re.compile(r'Breakpoint (\d+)(?: at .* file ([^,]+), line (\d+)|, .* at ([^:]+):(\d+))')
+
+
+# Reply to a tokenized -data-evaluate-expression: token, result class and
+# the value if the query succeeded, e.g. '12^done,value="5"' or '12^error,msg="..."'
+_HOVER_REPLY_RE = re.compile(r'(\d+)\^(done|error)(?:,value="(.*)")?')
+# Function values, e.g. "{int (void)} 0x7ff7625314fd <main>"
+_FUNCTION_ADDRESS_RE = re.compile(r'^\{.*\}.*<.*>$')
+# Characters dropped from hovered values: quotes and line breaks
+_VALUE_DELETE_TABLE = str.maketrans('', '', '"\r\n')
+# Escape sequences in hovered values and their replacements
+_VALUE_ESCAPE_RE = re.compile(r'\\[nrt\\]')
+_VALUE_ESCAPES = {'\\n': '', '\\r': '', '\\t': ' ', '\\\\': ''}
+
+
+def _replace_value_escape(match) -> str:
+    """Return the replacement of an escape sequence in a hovered value."""
+    return _VALUE_ESCAPES[match.group(0)]
+
+
+def _clean_variable_value(value: str) -> str:
+    """
+    Clean a value printed by GDB for display in a tooltip.
+
+    Args:
+        value: Text following the '=' of the print output
+
+    Returns:
+        str: Value without quotes, escape sequences and repeated whitespace
+    """
+    # Remove all double quotes (not just surrounding) and line breaks in one pass
+    value = value.translate(_VALUE_DELETE_TABLE)
+    # Handle escape sequences (e.g. the trailing \n of console output)
+    if '\\' in value:
+        value = _VALUE_ESCAPE_RE.sub(_replace_value_escape, value)
+    # Collapse multiple spaces and trim
+    return ' '.join(value.split())
+
+
+@contextmanager
+def _updates_suspended(widget):
+    """
+    Suspend painting, sorting and signals of a tree view while it is repopulated.
+
+    Args:
+        widget: Tree view to sort and repaint once when the block exits
+    """
+    was_sorting = widget.isSortingEnabled()
+    widget.setSortingEnabled(False)
+    widget.setUpdatesEnabled(False)
+    was_blocked = widget.blockSignals(True)
+    try:
+        yield widget
+    finally:
+        widget.blockSignals(was_blocked)
+        widget.setSortingEnabled(was_sorting)
+        widget.setUpdatesEnabled(True)
+
+
+def _remove_ansi_escape_codes(text: str) -> str:
+    """Remove ANSI escape sequences from text."""
+    # Almost no GDB output contains escapes, so skip the regex scan for it
+    if '\x1b' not in text:
+        return text
+    return _ANSI_RE.sub('', text)
+
+
+def _strip_matching_quotes(text: str, quotes: str = '"\'') -> str:
+    """
+    Remove a pair of quotes wrapping the whole text.
+
+    Args:
+        text: Text to unquote
+        quotes: Quote characters that are removed
+
+    Returns:
+        str: Text without the wrapping quotes
+    """
+    first = text[:1]
+    if first and first in quotes and text.endswith(first):
+        return text[1:-1]
+    return text
+
+
+def _clean_notify_output(output: str) -> str:
+    """Clean MI notification (=) records."""
+    # Look for patterns like =thread-group-started or =breakpoint-created
+    # We'll skip most of these unless they contain error information
+    if 'error' in output.lower():
+        # Extract error message from MI output
+        return _finalize_output_line(output)
+    return ""
+
+
+def _clean_result_output(output: str) -> str:
+    """Clean MI result (^) records."""
+    # Skip everything but errors
+    if not output.startswith('^error'):
+        return ""
+
+    # Pattern: ^error,msg="Error message here"
+    match = _MI_ERROR_MSG_RE.search(output)
+    if match:
+        error_msg = match.group(1)
+        # Filter out "Undefined MI command: exec-abort" error
+        if "Undefined MI command: exec-abort" in error_msg:
+            return ""
+        return _finalize_output_line(f"Error: {error_msg}")
+    return _finalize_output_line("Error (no message)")
+
+
+def _skip_output(output: str) -> str:
+    """Skip async records like *running, *stopped; they are not user-requested prints."""
+    return ""
+
+
+def _clean_other_output(output: str) -> str:
+    """Clean output without an MI prefix."""
+    cleaned = output.strip()
+    if cleaned == '(gdb)':
+        # Skip prompt
+        return ""
+
+    # Keep as-is but check if it's variable or error
+    # Remove quotes
+    cleaned = _strip_matching_quotes(_strip_matching_quotes(cleaned, "'"), '"')
+    cleaned = cleaned.replace('\\"', '"').replace('\\\\', '\\')
+    return _finalize_output_line(cleaned)
+
+
+def _finalize_output_line(cleaned: str) -> str:
+    """
+    Apply the cleanup shared by all displayed GDB output.
+
+    Args:
+        cleaned: Output text with the GDB/MI prefix already removed
+
+    Returns:
+        str: Text to display, or an empty string if it is noise
+    """
+    # Remove ANSI escape codes
+    cleaned = _remove_ansi_escape_codes(cleaned)
+
+    # Check if this should be displayed (not filtered as noise)
+    if _is_output_noise(cleaned):
+        return ""
+
+    # Clean up quotes around source code lines if present
+    cleaned = _SRC_LINE_RE.sub(r'\1', cleaned)
+
+    # Strip whitespace (including newlines) from start and end
+    is_variable = _VARIABLE_OUTPUT_RE.search(cleaned) is not None
+    cleaned = cleaned.strip()
+
+    # Process variable output (keep $number = prefix, remove quotes from value)
+    if is_variable:
+        # Remove quotes from value part only (e.g., $1 = "value" -> $1 = value)
+        # Match pattern: $number = "value" or $number = 'value'
+        match = _VARIABLE_VALUE_RE.match(cleaned)
+        if match:
+            # Reconstruct without quotes around value
+            return match.group(1) + match.group(3)
+
+    # Remove quotes if they are around the whole output
+    return _strip_matching_quotes(cleaned)
+
+
+@lru_cache(maxsize=2048)
+def _is_output_noise(output: str) -> bool:
+    """Check if output should be filtered out as noise."""
+    if not output:
+        return True
+
+    if output.startswith(_NOISE_PREFIXES) or _NOISE_RE.match(output):
+        return True
+
+    # Filter empty or mostly empty Type messages
+    stripped = output.strip()
+    if stripped == 'Type ""' or stripped == 'Type':
+        return True
+
+    # Filter lines that are just punctuation, quotes, or very short
+    if len(stripped) <= 3 and _SHORT_PUNCTUATION_RE.match(output):
+        return True
+
+    return False
+
+
+def _unescape_stream_match(match) -> str:
+    """Return the text an escape sequence in a stream record stands for."""
+    return _STREAM_ESCAPES.get(match.group(1), match.group(0))
+
+
+def _make_stream_cleaner(record_type: str):
+    """
+    Build the cleaner for a stream record type with its constants bound.
+
+    Args:
+        record_type: Stream record prefix, '~' (console) or '&' (log)
+
+    Returns:
+        Function cleaning a single record of that type
+    """
+    body_start = len(record_type) + 1  # Prefix and opening quote
+
+    def clean_stream_output(output: str, _finalize=_finalize_output_line) -> str:
+        # Remove prefix and quotes for console output
+        cleaned = output[body_start:-1] if output.endswith('"') else output[body_start:]
+        # Unescape newlines, quotes and backslashes in a single pass
+        if '\\' in cleaned:
+            cleaned = _STREAM_ESCAPE_RE.sub(_unescape_stream_match, cleaned)
+        # Remove single quotes if they wrap the entire output
+        return _finalize(_strip_matching_quotes(cleaned, "'"))
+
+    clean_stream_output.__doc__ = f"Clean {record_type} stream records."
+    return clean_stream_output
+
+
+# Output cleaner for each GDB/MI record prefix, built once at import
+_OUTPUT_CLEANERS = {
+    '~': _make_stream_cleaner('~'),
+    '&': _make_stream_cleaner('&'),
+    '=': _clean_notify_output,
+    '^': _clean_result_output,
+    '*': _skip_output,
+}
+
+
+@lru_cache(maxsize=2048)
+def _clean_output_line(output: str, _cleaners=_OUTPUT_CLEANERS,
+                       _default=_clean_other_output) -> str:
+    """
+    Clean a line of GDB/MI output by removing prefixes and formatting.
+
+    Lines such as prompts and async records repeat verbatim throughout a
+    session, so results are cached by the raw line.
+
+    Args:
+        output: Raw GDB output line
+
+    Returns:
+        str: Text to display, or an empty string if nothing should be shown
+    """
+    # Drop the line terminator so the closing quote of a record is found
+    output = output.rstrip('\r\n')
+    return _cleaners.get(output[:1], _default)(output)
+
+
+def _clean_output_lines(lines: List[str]) -> str:
+    """
+    Clean a batch of GDB output lines for display.
+
+    Args:
+        lines: Raw GDB output lines
+
+    Returns:
+        str: Lines to display joined with newlines, or an empty string if none
+    """
+    return '\n'.join(filter(None, map(_clean_output_line, lines)))
+
+
+def _find_initial_source(program_path: str) -> Tuple[str, Optional[str]]:
+    """
+    Find the C source file to show for a program.
+
+    Args:
+        program_path: Path to the program executable
+
+    Returns:
+        Tuple of the program path and the path of its source file, or None
+        if no C file was found
+    """
+    # Source named after the program, e.g. simple_program.exe -> simple_program.c
+    c_file = os.path.splitext(program_path)[0] + '.c'
+    if os.path.isfile(c_file):
+        return program_path, c_file
+
+    # Try to find any .c file in the same directory
+    directory = os.path.dirname(program_path)
+    try:
+        with os.scandir(directory or os.curdir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.c') and entry.is_file():
+                    return program_path, os.path.join(directory, entry.name)
+    except OSError:
+        pass
+    return program_path, None
+
+
+def _query_variable_children(gdb_controller: GDBController, node_data: dict,
+                             deliver: Callable) -> Tuple[dict, Callable, Optional[str], List[Dict[str, str]]]:
+    """
+    List the children of an expanded variable through GDB variable objects.
+
+    The variable object is created first if the row does not have one yet.
+
+    Args:
+        gdb_controller: Controller the MI queries are sent through
+        node_data: Row data holding the expression and, once created, the variable object name
+        deliver: Callback of the tree model receiving the children
+
+    Returns:
+        Tuple of the row data, the callback, the variable object name (None
+        if it could not be created) and the children listed by GDB
+    """
+    varobj_name = node_data.get('varobj')
+    if varobj_name is None:
+        varobj = gdb_controller.create_variable_object(node_data['expression'])
+        if not varobj:
+            return node_data, deliver, None, []
+        varobj_name = varobj['name']
+    return node_data, deliver, varobj_name, gdb_controller.list_variable_children(varobj_name)
+
+
+class _HoverState:
+    """
+    A variable hovered in the source viewer.
+
+    The latest hover is kept by the main window; hover queries sent to GDB
+    refer to the hover they answer, so a reply is shown only if that hover
+    is still the latest one.
+    """
+
+    __slots__ = ('name', 'stop_id')
+
+    def __init__(self, name: str, stop_id: int):
+        self.name = name
+        self.stop_id = stop_id  # Stop during which the variable was hovered
 
 
 class MainWindow(QMainWindow):
@@ -25,23 +493,105 @@ class MainWindow(QMainWindow):
     Main window that contains all debugger components.
     """
 
+    # Shared fonts, created on first use because QFont needs a QApplication
+    _UI_FONT = None  # Larger font for panes and toolbar
+    _MONO_FONT = None  # Larger font for GDB output
+    _DIALOG_FONT = None  # Font for dialogs
+
     def __init__(self, gdb_controller: GDBController):
         super().__init__()
         self.gdb_controller = gdb_controller
 
+        if MainWindow._UI_FONT is None:
+            MainWindow._UI_FONT = QFont("Arial", 18)
+            MainWindow._MONO_FONT = QFont("Courier New", 18)
+            MainWindow._DIALOG_FONT = QFont("Arial", 14)
+
         # Initialize managers
         self.breakpoint_manager = BreakpointManager(gdb_controller)
         self.variable_inspector = VariableInspector(gdb_controller)
 
         # Variable hover tracking
-        self.pending_variable_queries = {}
-        self.current_hover_variable = None
+        self._hover = None  # Latest _HoverState
+        self._hover_futures = {}  # MI token -> _HoverState the query answers
+
+        # Hovered values are cached per stop: (stop id, variable name) -> value
+        self._stop_id = 0
+        self._hover_cache = OrderedDict()
+        self._stopped_since_ms = 0  # Monotonic time of the last stop
+
+        # GDB variable objects created for expanded variables (deleted on refresh)
+        self._variable_objects = []
 
         # Register display settings
         self.register_format = "x"  # Default: hexadecimal
         self.previous_register_values = {}  # For change detection
+        # Register names and numbers of the target, fixed while a program is loaded
+        self._register_layout = None
         self.syntax_highlight_style = "xcode"  # Default syntax highlighting style
 
+        # Basename of the file shown in the source viewer, matched against
+        # file names in breakpoint output
+        self._current_file_basename = None
+
+        # Blocking GDB queries run on a worker thread so the UI stays responsive
+        self._gdb_worker = BackgroundWorker()
+        self._gdb_worker.reply.connect(self._handle_worker_reply)
+        self._gdb_worker.failed.connect(self._handle_worker_failure)
+
+        # GDB output is cleaned for display on its own worker thread, so it
+        # never waits behind a blocking query
+        self._output_worker = BackgroundWorker()
+        self._output_worker.reply.connect(self._handle_worker_reply)
+        self._output_worker.failed.connect(self._handle_worker_failure)
+
+        # The source file search touches the file system, which can be slow
+        # on network drives, so it runs on its own worker thread
+        self._file_worker = BackgroundWorker()
+        self._file_worker.reply.connect(self._handle_worker_reply)
+        self._file_worker.failed.connect(self._handle_worker_failure)
+
+        # Source file found for each program path by load_initial_source
+        self._initial_source_cache = {}
+        # Program whose source is shown when its search finishes
+        self._pending_initial_source = None
+
+        # Debug panes not refreshed since the program last stopped
+        self._stale_panes = set()
+
+        # GDB output lines are buffered and processed in batches, so a burst of
+        # output costs one text append instead of one per line
+        self._pending_gdb_output = deque()
+        self._output_flush_timer = QTimer(self)
+        self._output_flush_timer.setSingleShot(True)
+        self._output_flush_timer.setInterval(30)  # Flush at most every 30 ms
+        self._output_flush_timer.timeout.connect(self._flush_gdb_output)
+
+        # Hover queries are coalesced; only the last hovered variable is queried
+        self._pending_hover_variable = None
+        self._hover_query_timer = QTimer(self)
+        self._hover_query_timer.setSingleShot(True)
+        self._hover_query_timer.setInterval(120)
+        self._hover_query_timer.timeout.connect(self._flush_variable_hover)
+
+        # Action of the Run/Continue button for each debugger state
+        self._run_or_continue_actions = {
+            'disconnected': self._start_execution,
+            'connected': self._start_execution,
+            'exited': self._start_execution,
+            'stopped': self._resume_execution,
+            'running': lambda: None,  # Already running
+        }
+
+        # Watchpoint dialog, built on first use and shared by add and edit;
+        # the target is the ID of the edited watchpoint (None when adding)
+        self._watchpoint_dialog = None
+        self._watchpoint_dialog_target = None
+
+        # GDB output area (created by setup_ui) and its context menu, built on first use
+        self.gdb_output_text = None
+        self._gdb_output_menu = None
+
         self.setup_ui()
         self.connect_signals()
 
@@ -105,47 +655,75 @@ class MainWindow(QMainWindow):
         # Tab widget for different debug views
         tab_widget = QTabWidget()
         splitter.addWidget(tab_widget)
-
-        # Variables tab
-        self.variables_tree = QTreeWidget()
-        self.variables_tree.setHeaderLabels(["Name", "Value", "Type"])
-        self.variables_tree.setFont(QFont("Arial", 18))  # Larger font
+        self.debug_tab_widget = tab_widget
+
+        # Variables tab (model/view: only visible rows are laid out and painted)
+        self.variables_model = DebugTreeModel(["Name", "Value", "Type"], self)
+        self.variables_model.set_children_loader(self._load_variable_children)
+        self.variables_tree = QTreeView()
+        self.variables_tree.setModel(self.variables_model)
+        self.variables_tree.setUniformRowHeights(True)
+        self.variables_tree.setItemDelegate(FixedRowDelegate(self.variables_tree))
+        self.variables_tree.setFont(self._UI_FONT)  # Larger font
         tab_widget.addTab(self.variables_tree, "Variables")
 
         # Watch expressions tab
-        self.watch_tree = QTreeWidget()
-        self.watch_tree.setHeaderLabels(["Expression", "Value"])
-        self.watch_tree.setFont(QFont("Arial", 18))  # Larger font
+        self.watch_model = DebugTreeModel(["Expression", "Value"], self)
+        self.watch_tree = QTreeView()
+        self.watch_tree.setModel(self.watch_model)
+        self.watch_tree.setUniformRowHeights(True)
+        self.watch_tree.setItemDelegate(FixedRowDelegate(self.watch_tree))
+        self.watch_tree.setFont(self._UI_FONT)  # Larger font
         tab_widget.addTab(self.watch_tree, "Watch")
 
         # Breakpoints tab
-        self.breakpoints_tree = QTreeWidget()
-        self.breakpoints_tree.setHeaderLabels(["File", "Line", "Condition"])
-        self.breakpoints_tree.setFont(QFont("Arial", 18))  # Larger font
+        self.breakpoints_model = DebugTreeModel(["File", "Line", "Condition"], self)
+        self.breakpoints_tree = QTreeView()
+        self.breakpoints_tree.setModel(self.breakpoints_model)
+        self.breakpoints_tree.setUniformRowHeights(True)
+        self.breakpoints_tree.setItemDelegate(FixedRowDelegate(self.breakpoints_tree))
+        self.breakpoints_tree.setFont(self._UI_FONT)  # Larger font
         tab_widget.addTab(self.breakpoints_tree, "Breakpoints")
 
         # Watchpoints tab
-        self.watchpoints_tree = QTreeWidget()
-        self.watchpoints_tree.setHeaderLabels(["Expression", "Type", "Enabled"])
-        self.watchpoints_tree.setFont(QFont("Arial", 18))  # Larger font
+        self.watchpoints_model = DebugTreeModel(["Expression", "Type", "Enabled"], self)
+        self.watchpoints_tree = QTreeView()
+        self.watchpoints_tree.setModel(self.watchpoints_model)
+        self.watchpoints_tree.setUniformRowHeights(True)
+        self.watchpoints_tree.setItemDelegate(FixedRowDelegate(self.watchpoints_tree))
+        self.watchpoints_tree.setFont(self._UI_FONT)  # Larger font
         self.watchpoints_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.watchpoints_tree.customContextMenuRequested.connect(self._show_watchpoints_context_menu)
         tab_widget.addTab(self.watchpoints_tree, "Watchpoints")
 
         # Registers tab
-        self.registers_tree = QTreeWidget()
-        self.registers_tree.setHeaderLabels(["Name", "Number", "Value"])
-        self.registers_tree.setFont(QFont("Arial", 18))  # Larger font
+        self.registers_model = DebugTreeModel(["Name", "Number", "Value"], self)
+        self.registers_model.set_highlight(2, QBrush(Qt.yellow))  # Changed values
+        self.registers_tree = QTreeView()
+        self.registers_tree.setModel(self.registers_model)
+        self.registers_tree.setUniformRowHeights(True)
+        self.registers_tree.setItemDelegate(FixedRowDelegate(self.registers_tree))
+        self.registers_tree.setFont(self._UI_FONT)  # Larger font
         self.registers_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.registers_tree.customContextMenuRequested.connect(self._show_registers_context_menu)
         tab_widget.addTab(self.registers_tree, "Registers")
 
         # Call stack tab
-        self.call_stack_tree = QTreeWidget()
-        self.call_stack_tree.setHeaderLabels(["Function", "File", "Line"])
-        self.call_stack_tree.setFont(QFont("Arial", 18))  # Larger font
+        self.call_stack_model = DebugTreeModel(["Function", "File", "Line"], self)
+        self.call_stack_tree = QTreeView()
+        self.call_stack_tree.setModel(self.call_stack_model)
+        self.call_stack_tree.setUniformRowHeights(True)
+        self.call_stack_tree.setItemDelegate(FixedRowDelegate(self.call_stack_tree))
+        self.call_stack_tree.setFont(self._UI_FONT)  # Larger font
         tab_widget.addTab(self.call_stack_tree, "Call Stack")
 
+        # Panes that query GDB when the program stops; hidden panes are
+        # refreshed when their tab is selected
+        self._pane_updaters = {
+            self.variables_tree: self._update_variables_tree,
+            self.registers_tree: self._update_registers_tree,
+        }
+
         # GDB output area
         gdb_output_widget = QWidget()
         gdb_output_layout = QVBoxLayout(gdb_output_widget)
@@ -157,21 +735,24 @@ class MainWindow(QMainWindow):
         # GDB command input
         self.gdb_command_input = QLineEdit()
         self.gdb_command_input.setPlaceholderText("Enter GDB command...")
-        self.gdb_command_input.setFont(QFont("Arial", 18))  # Larger font
+        self.gdb_command_input.setFont(self._UI_FONT)  # Larger font
         self.gdb_command_input.returnPressed.connect(self.execute_gdb_command)
         gdb_command_layout.addWidget(self.gdb_command_input)
 
         # Execute button
         self.gdb_execute_button = QPushButton("Execute")
-        self.gdb_execute_button.setFont(QFont("Arial", 18))  # Larger font
+        self.gdb_execute_button.setFont(self._UI_FONT)  # Larger font
         self.gdb_execute_button.clicked.connect(self.execute_gdb_command)
         gdb_command_layout.addWidget(self.gdb_execute_button)
 
         # GDB output text area
-        self.gdb_output_text = QTextEdit()
+        self.gdb_output_text = QPlainTextEdit()
         self.gdb_output_text.setReadOnly(True)
+        self.gdb_output_text.setUndoRedoEnabled(False)
+        # Keep the most recent output only, so long sessions stay fast to append to
+        self.gdb_output_text.setMaximumBlockCount(_GDB_OUTPUT_MAX_LINES)
         self.gdb_output_text.setPlaceholderText("GDB output will appear here...")
-        self.gdb_output_text.setFont(QFont("Courier New", 18))  # Larger font
+        self.gdb_output_text.setFont(self._MONO_FONT)  # Larger font
 
         # Enable context menu for GDB output text area
         self.gdb_output_text.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -192,8 +773,8 @@ class MainWindow(QMainWindow):
         toolbar = QToolBar("Main Toolbar")
         self.addToolBar(toolbar)
 
-        # Create font for toolbar actions
-        toolbar_font = QFont("Arial", 18)
+        # Font for toolbar actions
+        toolbar_font = self._UI_FONT
 
         # Load program action
         load_action = QAction("Load", self)
@@ -307,16 +888,11 @@ class MainWindow(QMainWindow):
 
     def _on_register_format_changed(self, format_text: str) -> None:
         """Handle register format selection change."""
-        format_map = {
-            "Hex": "x",
-            "Decimal": "d",
-            "Octal": "o",
-            "Binary": "b"
-        }
-        self.register_format = format_map.get(format_text, "x")
+        self.register_format = _REGISTER_FORMATS.get(format_text, "x")
         # Update register display if program is stopped
         if self.gdb_controller.current_state['state'] == 'stopped':
-            self._update_registers_tree()
+            self._stale_panes.add(self.registers_tree)
+            self._refresh_active_tab()
 
     def _on_syntax_style_selected(self, style: str) -> None:
         """Handle syntax highlighting style selection from dropdown menu."""
@@ -355,11 +931,11 @@ class MainWindow(QMainWindow):
 
         # Style selection
         style_label = QLabel("Select syntax highlighting style:")
-        style_label.setFont(QFont("Arial", 14))
+        style_label.setFont(self._DIALOG_FONT)
         layout.addWidget(style_label)
 
         style_combo = QComboBox()
-        style_combo.setFont(QFont("Arial", 14))
+        style_combo.setFont(self._DIALOG_FONT)
         style_combo.addItems(available_styles)
         # Set current selection
         current_style = self.source_viewer.highlight_style
@@ -371,9 +947,9 @@ class MainWindow(QMainWindow):
         # Buttons
         button_layout = QHBoxLayout()
         ok_button = QPushButton("OK")
-        ok_button.setFont(QFont("Arial", 14))
+        ok_button.setFont(self._DIALOG_FONT)
         cancel_button = QPushButton("Cancel")
-        cancel_button.setFont(QFont("Arial", 14))
+        cancel_button.setFont(self._DIALOG_FONT)
 
         button_layout.addWidget(ok_button)
         button_layout.addWidget(cancel_button)
@@ -420,16 +996,22 @@ class MainWindow(QMainWindow):
     def connect_signals(self) -> None:
         """Connect signals from GDB controller to UI updates."""
         self.gdb_controller.state_changed.connect(self.update_ui_state)
-        self.gdb_controller.output_received.connect(self.handle_gdb_output)
+        self.gdb_controller.output_received.connect(self._queue_gdb_output)
+        self.gdb_controller.output_batch_received.connect(self._queue_gdb_output_batch)
 
         # Connect source viewer signals
         self.source_viewer.breakpoint_toggled.connect(self.handle_breakpoint_toggle)
-        self.source_viewer.variable_hovered.connect(self.handle_variable_hover)
+        self.source_viewer.variable_hovered.connect(self._queue_variable_hover)
+        self.source_viewer.file_loaded.connect(self._on_source_file_loaded)
+
+        # Refresh a debug pane deferred while it was hidden once it is shown
+        self.debug_tab_widget.currentChanged.connect(self._refresh_active_tab)
 
         # Connect breakpoint manager signals
-        self.breakpoint_manager.watchpoint_added.connect(self._update_watchpoints_tree)
-        self.breakpoint_manager.watchpoint_removed.connect(self._update_watchpoints_tree)
-        self.breakpoint_manager.watchpoint_updated.connect(self._update_watchpoints_tree)
+        self.breakpoint_manager.watchpoint_added.connect(self._on_watchpoints_changed)
+        self.breakpoint_manager.watchpoint_removed.connect(self._on_watchpoints_changed)
+        self.breakpoint_manager.watchpoint_updated.connect(self._on_watchpoints_changed)
+        self.breakpoint_manager.bulk_changed.connect(self._update_watchpoints_tree)
 
     def run_or_continue(self) -> None:
         """Run program (if not started) or continue execution (if paused)."""
@@ -439,30 +1021,30 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Warning", "GDB is not running. Please load a program first.")
                 return
 
-            # Check current state to decide whether to run or continue
+            # Run a program that has not started or has exited, continue a paused one
             current_state = self.gdb_controller.current_state['state']
-
-            if current_state == 'disconnected' or current_state == 'connected' or current_state == 'exited':
-                # Program not started yet or has exited - run it
-                if self.gdb_controller.run():
-                    self.status_label.setText("Running program...")
-                else:
-                    QMessageBox.critical(self, "Error", "Failed to start program execution")
-            elif current_state == 'stopped':
-                # Program is paused - continue execution
-                if self.gdb_controller.continue_execution():
-                    self.status_label.setText("Continuing execution...")
-                else:
-                    QMessageBox.critical(self, "Error", "Failed to continue execution")
-            elif current_state == 'running':
-                # Program is already running
-                pass
-            else:
-                # Unknown state
-                QMessageBox.warning(self, "Warning", f"Cannot run/continue in state: {current_state}")
+            action = self._run_or_continue_actions.get(current_state)
+            if action is None:
+                self._show_error(f"Cannot run/continue in state: {current_state}")
+                return
+            action()
 
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to run/continue program: {e}")
+            self._show_error(f"Failed to run/continue program: {e}")
+
+    def _start_execution(self) -> None:
+        """Run the loaded program from the start."""
+        if self.gdb_controller.run():
+            self.status_label.setText("Running program...")
+        else:
+            self._show_error("Failed to start program execution")
+
+    def _resume_execution(self) -> None:
+        """Continue the paused program."""
+        if self.gdb_controller.continue_execution():
+            self.status_label.setText("Continuing execution...")
+        else:
+            self._show_error("Failed to continue execution")
 
     def run_program(self) -> None:
         """Start program execution."""
@@ -472,47 +1054,56 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Warning", "GDB is not running. Please load a program first.")
                 return
 
-            if self.gdb_controller.run():
-                self.status_label.setText("Running program...")
-            else:
-                QMessageBox.critical(self, "Error", "Failed to start program execution")
+            self._start_execution()
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to run program: {e}")
+            self._show_error(f"Failed to run program: {e}")
 
     def pause_program(self) -> None:
         """Pause program execution."""
         try:
             self.gdb_controller.pause()
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to pause program: {e}")
+            self._show_error(f"Failed to pause program: {e}")
 
     def step_over(self) -> None:
         """Step over current line."""
         try:
             self.gdb_controller.step_over()
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to step over: {e}")
+            self._show_error(f"Failed to step over: {e}")
 
     def step_into(self) -> None:
         """Step into function call."""
         try:
             self.gdb_controller.step_into()
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to step into: {e}")
+            self._show_error(f"Failed to step into: {e}")
 
     def step_out(self) -> None:
         """Step out of current function."""
         try:
             self.gdb_controller.step_out()
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to step out: {e}")
+            self._show_error(f"Failed to step out: {e}")
 
     def continue_execution(self) -> None:
         """Continue program execution."""
         try:
             self.gdb_controller.continue_execution()
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to continue: {e}")
+            self._show_error(f"Failed to continue: {e}")
+
+    def _show_error(self, message: str) -> None:
+        """
+        Show an execution error in the status bar.
+
+        Unlike a message box this does not run a nested event loop, so GDB
+        output keeps being processed. The message is cleared after a while.
+
+        Args:
+            message: Error message to show
+        """
+        self.statusBar().showMessage(f"Error: {message}", _ERROR_MESSAGE_MS)
 
     def update_ui_state(self, state_info: dict) -> None:
         """Update UI based on current debugger state."""
@@ -520,6 +1111,20 @@ class MainWindow(QMainWindow):
         state = state_info.get('state', 'unknown')
         self.status_label.setText(f"State: {state}")
 
+        # Variable values may change whenever the program runs or stops again
+        if state in ('stopped', 'running'):
+            self._stop_id += 1
+            self._hover_cache.clear()
+            if state == 'stopped':
+                self._stopped_since_ms = time.monotonic_ns() // 1_000_000
+        else:
+            # A program loaded next may target another architecture
+            self._register_layout = None
+
+        # Hover queries still pending are never answered for this stop
+        if state in ('running', 'exited', 'disconnected'):
+            self._hover_futures.clear()
+
         # Check if we have valid line information to highlight
         has_valid_line = ('file' in state_info and 'line' in state_info and
                          state_info['line'] is not None and state_info['line'] > 0)
@@ -537,430 +1142,270 @@ class MainWindow(QMainWindow):
             else:
                 self.current_file_label.setText("No file loaded")
 
-        # Update registers and variables when program is stopped
+        # Update registers and variables when program is stopped; only the
+        # pane in the current tab queries GDB now
         if state == 'stopped':
-            self._update_registers_tree()
-            self._update_variables_tree()
-
-    def handle_gdb_output(self, output: str) -> None:
-        """Handle output received from GDB."""
-        # Process GDB output and update relevant UI components
-
-        # Handle breakpoint creation from GDB commands
-        self._handle_breakpoint_output(output)
-
-        # Handle variable value extraction for tooltips
-        self._handle_variable_output(output)
-
-        # Display output in the GDB output area
-        if hasattr(self, 'gdb_output_text'):
-            # Clean up the output by removing GDB/MI prefixes
-            clean_output = self._clean_gdb_output(output)
-            if clean_output:
-                self.gdb_output_text.append(clean_output)
-                # Auto-scroll to bottom
-                cursor = self.gdb_output_text.textCursor()
-                cursor.movePosition(cursor.End)
-                self.gdb_output_text.setTextCursor(cursor)
+            self._stale_panes = set(self._pane_updaters)
+            self._refresh_active_tab()
+
+    def _refresh_active_tab(self, index: int = -1) -> None:
+        """
+        Refresh the debug pane in the current tab if it is out of date.
+
+        Args:
+            index: Index of the current tab (unused, the current widget is looked up)
+        """
+        pane = self.debug_tab_widget.currentWidget()
+        if pane not in self._stale_panes:
+            return
+        self._stale_panes.discard(pane)
+        self._pane_updaters[pane]()
+
+    def _queue_gdb_output(self, output: str) -> None:
+        """Buffer a line of GDB output; buffered lines are handled when the flush timer fires."""
+        self._pending_gdb_output.append(output)
+        if not self._output_flush_timer.isActive():
+            self._output_flush_timer.start()
+
+    def _queue_gdb_output_batch(self, lines: list) -> None:
+        """Buffer lines read from GDB in one batch."""
+        self._pending_gdb_output.extend(lines)
+        if not self._output_flush_timer.isActive():
+            self._output_flush_timer.start()
+
+    def _flush_gdb_output(self) -> None:
+        """Handle all buffered GDB output lines and display them with a single insert."""
+        lines = list(self._pending_gdb_output)
+        self._pending_gdb_output.clear()
+        for output in lines:
+            # Breakpoint markers and hover replies update the UI right away
+            self._handle_breakpoint_output(output)
+            self._handle_variable_output(output)
+
+        # The displayed text is appended when the output worker replies
+        self._output_worker.submit('output', _clean_output_lines, lines)
+
+    def _append_gdb_output_text(self, text: str) -> None:
+        """Append text as new lines of the GDB output area and scroll to the bottom."""
+        output_text = self.gdb_output_text
+        cursor = output_text.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        if not output_text.document().isEmpty():
+            text = '\n' + text
+
+        # Insert the whole batch as one edit (including the trimming of lines
+        # over the block limit), with one layout pass
+        output_text.setUpdatesEnabled(False)
+        cursor.beginEditBlock()
+        cursor.insertText(text)
+        cursor.endEditBlock()
+        output_text.setUpdatesEnabled(True)
+
+        # Auto-scroll to bottom through the scroll bar; moving the widget's
+        # cursor would emit cursorPositionChanged for every batch
+        scroll_bar = output_text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
 
     def _clean_gdb_output(self, output: str) -> str:
         """Clean GDB/MI output by removing prefixes and formatting."""
-        import re
-
-        # First check if this is a variable print output or error message
-        # Variable print output typically looks like: ~"$1 = 5"
-        # Error messages typically start with ^error or &"Error
-
-        # Extract the actual content regardless of prefix
-        cleaned = ""
-        if output.startswith('~') or output.startswith('&'):
-            # Remove prefix and quotes for console output
-            cleaned = output[2:-1] if output.endswith('"') else output[2:]
-            # Remove escaped newlines
-            cleaned = cleaned.replace('\\n', '\n')
-            # Remove single quotes if they wrap the entire output
-            if cleaned.startswith("'") and cleaned.endswith("'"):
-                cleaned = cleaned[1:-1]
-            # Remove escaped quotes and backslashes
-            cleaned = cleaned.replace('\\"', '"').replace('\\\\', '\\')
-        elif output.startswith('='):
-            # MI result records - check if they contain variable values
-            # Look for patterns like =thread-group-started or =breakpoint-created
-            # We'll skip most of these unless they contain error information
-            if 'error' in output.lower():
-                # Extract error message from MI output
-                cleaned = output
-            else:
-                return ""
-        elif output.startswith('^'):
-            # MI result records - check for errors
-            if output.startswith('^error'):
-                # This is an error message, extract it
-                # Pattern: ^error,msg="Error message here"
-                match = re.search(r'msg="([^"]+)"', output)
-                if match:
-                    error_msg = match.group(1)
-                    # Filter out "Undefined MI command: exec-abort" error
-                    if "Undefined MI command: exec-abort" in error_msg:
-                        return ""
-                    cleaned = f"Error: {error_msg}"
-                else:
-                    cleaned = "Error (no message)"
-            else:
-                # Skip other ^ records
-                return ""
-        elif output.strip() == '(gdb)':
-            # Skip prompt
-            return ""
-        elif output.startswith('*'):
-            # Async output like *running, *stopped
-            # Skip these as they are not user-requested variable prints
-            return ""
-        else:
-            # Other output - keep as-is but check if it's variable or error
-            cleaned = output.strip()
-            # Remove quotes
-            if cleaned.startswith("'") and cleaned.endswith("'"):
-                cleaned = cleaned[1:-1]
-            if cleaned.startswith('"') and cleaned.endswith('"'):
-                cleaned = cleaned[1:-1]
-            cleaned = cleaned.replace('\\"', '"').replace('\\\\', '\\')
-
-        # Remove ANSI escape codes
-        cleaned = self._remove_ansi_escape_codes(cleaned)
-
-        # Check if this should be displayed (not filtered as noise)
-        if self._should_filter_output(cleaned):
-            return ""
-
-        # Clean up quotes around source code lines if present
-        cleaned = re.sub(r'"(\d+\\t.*?)"', r'\1', cleaned)
-
-        # Process variable output (keep $number = prefix, remove quotes from value)
-        variable_pattern = r'^\$\d+\s*='
-        if re.search(variable_pattern, cleaned) is not None:
-            # Strip whitespace (including newlines) from start and end
-            cleaned = cleaned.strip()
-            # Remove quotes from value part only (e.g., $1 = "value" -> $1 = value)
-            # Match pattern: $number = "value" or $number = 'value'
-            match = re.match(r'^(\$\d+\s*=\s*)([\'"]?)(.*?)\2$', cleaned)
-            if match:
-                # Reconstruct without quotes around value
-                cleaned = match.group(1) + match.group(3)
-            # Also handle cases where quotes might be around the whole output
-            elif cleaned.startswith('"') and cleaned.endswith('"'):
-                cleaned = cleaned[1:-1]
-            elif cleaned.startswith("'") and cleaned.endswith("'"):
-                cleaned = cleaned[1:-1]
-
-        # For other outputs, just strip whitespace
-        else:
-            cleaned = cleaned.strip()
-            # Remove surrounding quotes if present
-            if cleaned.startswith('"') and cleaned.endswith('"'):
-                cleaned = cleaned[1:-1]
-            elif cleaned.startswith("'") and cleaned.endswith("'"):
-                cleaned = cleaned[1:-1]
-
-        return cleaned
+        return _clean_output_line(output)
 
     def _should_filter_output(self, output: str) -> bool:
         """Check if output should be filtered out as noise."""
-        if not output:
-            return True
-
-        # Common noise patterns (case-insensitive)
-        noise_patterns = [
-            r'^GNU gdb.*',
-            r'^Copyright.*',
-            r'^License GPL.*',
-            r'^This is free software.*',
-            r'^There is NO WARRANTY.*',
-            r'^Type.*show copying.*',
-            r'^Type.*show warranty.*',
-            r'^This GDB was configured as.*',
-            r'^Type.*show configuration.*',
-            r'^For bug reporting instructions.*',
-            r'^Find the GDB manual.*',
-            r'^For help, type.*',
-            r'^Type.*apropos word.*',
-            r'^\s*$',  # Empty or whitespace-only lines
-            # URLs related to GDB documentation and bug reporting
-            r'^<https?://.*gnu\.org/software/gdb.*>.*',
-            r'^<https?://www\.gnu\.org/software/gdb.*>.*',
-            # General GDB info URLs
-            r'^<https?://.*gnu\.org/licenses/.*>.*',
-            # Lines that are just URLs in angle brackets
-            r'^<[^>]*>\s*\.?$',
-            # Incomplete lines from split output
-            r'^Type\s*".*',
-            r'^show copying.*',
-            r'^<".*',
-            r'.*gnu\.org/software/gdb.*',
-            r'^".*',  # Lines that start with a quote
-            # GDB/MI asynchronous notifications (technical details)
-            r'^\*?running,thread-id=.*',
-            r'^\*?stopped,reason=.*',
-            r'^\*?breakpoint-hit,.*',
-            r'^\*?thread-created,.*',
-            r'^\*?thread-exited,.*',
-            r'^\*?library-loaded,.*',
-            r'^\*?library-unloaded,.*',
-            # GDB/MI status messages with technical parameters
-            r'.*thread-id="\d+".*',
-            r'.*frame=\{.*',
-            r'.*stopped-threads=.*',
-            r'.*arch=".*".*',
-        ]
-
-        import re
-        for pattern in noise_patterns:
-            if re.match(pattern, output, re.IGNORECASE):
-                return True
-
-        # Also filter lines that are just punctuation or very short noise
-        if re.match(r'^[\s\"\'\\]*$', output):
-            return True
-
-        # Filter GDB command echo (e.g., "p sum", "print fib_result")
-        if re.match(r'^(p|print|break|watch|display|info|run|continue|next|step|finish|kill|quit)\s+', output, re.IGNORECASE):
-            return True
-
-        # Filter lines that contain command prompts but no actual output
-        if re.match(r'^\(\w+\)\s*$', output):
-            return True
-
-        # Filter GDB help and info lines that may be split across multiple lines
-        if re.match(r'^Type\s*".*', output, re.IGNORECASE):
-            return True
-        if re.match(r'^show\s+\w+.*', output, re.IGNORECASE):
-            return True
-        if re.match(r'.*for details.*', output, re.IGNORECASE):
-            return True
-        if re.match(r'.*for configuration details.*', output, re.IGNORECASE):
-            return True
-        if re.match(r'.*to search for commands.*', output, re.IGNORECASE):
-            return True
-
-        # Filter MI command responses (e.g., "1^done,register-names=...", "2^done,register-values=...")
-        if re.match(r'^\d+\^done,.*', output):
-            return True
-        if re.match(r'^\d+\^error,.*', output):
-            return True
-
-        # Filter GDB status messages (but keep breakpoint hits and source lines per user request)
-        if re.match(r'^Reading symbols from.*', output):
-            return True
-        if re.match(r'^\[New Thread.*\]', output):
-            return True
-        # Note: Thread hit Breakpoint and source code lines are kept - DO NOT filter them
-        # if re.match(r'^Thread \d+ hit Breakpoint.*', output):
-        #     return True
-        # if re.match(r'^\d+\s+.*at .*:\d+', output):  # Source code lines like "33    fib_result = fibonacci(number);"
-        #     return True
-        # if re.match(r'.* at .*:\d+', output):  # Function at file:line
-        #     return True
-
-        # Filter empty or mostly empty Type messages
-        if output.strip() == 'Type ""':
-            return True
-        if output.strip() == 'Type':
-            return True
-        if re.match(r'^Type\s*"?"?$', output):  # Type "" or Type "?"
-            return True
-
-        # Filter lines that are just punctuation, quotes, or very short
-        if len(output.strip()) <= 3 and re.match(r'^[\s\"\'\\\.\?]*$', output):
-            return True
-
-        return False
+        return _is_output_noise(output)
 
     def _remove_ansi_escape_codes(self, text: str) -> str:
         """Remove ANSI escape sequences from text."""
-        import re
-        # 7-bit C1 ANSI sequences
-        ansi_escape = re.compile(r'''
-            \x1B  # ESC
-            (?:   # 7-bit C1 Fe (except CSI)
-                [@-Z\\-_]
-            |     # or [ for CSI, followed by a control sequence
-                \[
-                [0-?]*  # Parameter bytes
-                [ -/]*  # Intermediate bytes
-                [@-~]   # Final byte
-            )
-        ''', re.VERBOSE)
-        return ansi_escape.sub('', text)
+        return _remove_ansi_escape_codes(text)
 
     def _handle_breakpoint_output(self, output: str) -> None:
         """Handle GDB output related to breakpoint creation."""
-        import re
+        # Most output is unrelated to breakpoints
+        if 'Breakpoint' not in output:
+            return
 
         # Look for breakpoint creation messages
         # Examples: "Breakpoint 1 at 0x401530: file simple_program.c, line 5."
         # Or: "Breakpoint 1, main () at simple_program.c:5"
+        match = _BREAKPOINT_RE.search(output)
+        if not match:
+            return
 
-        # Pattern for breakpoint creation
-        bp_pattern1 = r'Breakpoint (\d+) at .* file ([^,]+), line (\d+)'
-        bp_pattern2 = r'Breakpoint (\d+), .* at ([^:]+):(\d+)'
-
-        match1 = re.search(bp_pattern1, output)
-        match2 = re.search(bp_pattern2, output)
+        if match.group(2) is not None:
+            file_path, line = match.group(2, 3)
+        else:
+            file_path, line = match.group(4, 5)
+        self._add_breakpoint_visual_marker(file_path, int(line))
 
-        if match1:
-            bp_id = int(match1.group(1))
-            file_path = match1.group(2)
-            line_number = int(match1.group(3))
-            self._add_breakpoint_visual_marker(file_path, line_number)
-        elif match2:
-            bp_id = int(match2.group(1))
-            file_path = match2.group(2)
-            line_number = int(match2.group(3))
-            self._add_breakpoint_visual_marker(file_path, line_number)
+    def _on_source_file_loaded(self, file_path: str) -> None:
+        """Remember the basename of the file loaded into the source viewer."""
+        self._current_file_basename = os.path.basename(file_path)
 
     def _add_breakpoint_visual_marker(self, file_path: str, line_number: int) -> None:
         """Add visual breakpoint marker if the file matches current source."""
-        if (hasattr(self.source_viewer, 'current_file') and
-            self.source_viewer.current_file and
-            file_path in self.source_viewer.current_file):
-
+        if (self._current_file_basename and
+                os.path.basename(file_path) == self._current_file_basename):
             # Add visual marker
             self.source_viewer.add_breakpoint_marker(line_number)
 
     def _handle_variable_output(self, output: str) -> None:
-        """Extract variable values from GDB output for tooltips."""
-        import re
-
-        # Check if this output contains a variable value from a pending query
-        if not self.pending_variable_queries or not self.current_hover_variable:
+        """Route the reply to a hover query to the variable it was sent for."""
+        # Replies start with the token of the query: 12^done,value="5"
+        if not self._hover_futures or not output[:1].isdigit():
+            return
+        match = _HOVER_REPLY_RE.match(output)
+        if not match:
+            return
+        hover = self._hover_futures.pop(int(match.group(1)), None)
+        if hover is None:
             return
 
-        # Skip error messages
-        if output.startswith('^error'):
-            # Remove from pending queries without updating tooltip
-            if self.current_hover_variable in self.pending_variable_queries:
-                del self.pending_variable_queries[self.current_hover_variable]
-                # Hide tooltip for errors
+        # Errors (e.g. no symbol in current context) carry no value
+        value = match.group(3) if match.group(2) == 'done' else None
+        if value is not None:
+            # Quotes inside the MI string are escaped: value="0x4005d0 \"hi\""
+            value = _clean_variable_value(value.replace('\\"', '"'))
+        self._apply_hover_value(hover, value)
+
+    def _apply_hover_value(self, hover: _HoverState, value: Optional[str]) -> None:
+        """
+        Cache a hovered variable's value and show it if it answers the latest hover.
+
+        Args:
+            hover: Hover the query was sent for
+            value: Value returned by GDB, or None if the query failed
+        """
+        is_current = hover is self._hover
+
+        # Hide the tooltip for errors and function addresses
+        # (e.g., "{int (void)} 0x7ff7625314fd <main>")
+        if value is None or _FUNCTION_ADDRESS_RE.match(value):
+            if is_current:
                 QToolTip.hideText()
             return
 
-        # Pattern to match GDB print output like "$1 = 5" or "$272 = 5"
-        # Also handles arrays and structures
-        value_pattern = r'=\s*(.+)'
+        # Cache the value for the stop it was queried in
+        if hover.stop_id == self._stop_id:
+            self._hover_cache[(hover.stop_id, hover.name)] = value
+            if len(self._hover_cache) > _HOVER_CACHE_SIZE:
+                self._hover_cache.popitem(last=False)
 
-        match = re.search(value_pattern, output)
-        if match:
-            variable_value = match.group(1).strip()
-            # Clean up the value: remove quotes and escape sequences
-            # Remove all double quotes (not just surrounding)
-            variable_value = variable_value.replace('"', '')
-            # Remove any remaining "= " prefix just in case
-            if variable_value.startswith('= '):
-                variable_value = variable_value[2:]
-            elif variable_value.startswith('='):
-                variable_value = variable_value[1:]
-            # Handle escape sequences - both literal backslash-n and actual newlines
-            variable_value = variable_value.replace('\\n', '').replace('\\r', '').replace('\\t', ' ')
-            variable_value = variable_value.replace('\n', '').replace('\r', '')
-            # Also handle escaped backslashes and quotes
-            variable_value = variable_value.replace('\\\\', '').replace('\\"', '')
-            # Collapse multiple spaces and trim
-            variable_value = ' '.join(variable_value.split())
-            # Final trim
-            variable_value = variable_value.strip()
-
-            # Skip function addresses (e.g., "{int (void)} 0x7ff7625314fd <main>")
-            # This pattern matches function type signatures
-            if re.match(r'^\{.*\}.*<.*>$', variable_value):
-                # Remove from pending queries without updating tooltip
-                if self.current_hover_variable in self.pending_variable_queries:
-                    del self.pending_variable_queries[self.current_hover_variable]
-                    # Hide tooltip for function addresses
-                    QToolTip.hideText()
-                return
-
-            # Check if this is for our current hover variable
-            if self.current_hover_variable in self.pending_variable_queries:
-                # Update the tooltip with the actual value
-                self._update_variable_tooltip(self.current_hover_variable, variable_value)
-
-                # Remove from pending queries
-                del self.pending_variable_queries[self.current_hover_variable]
-                print(f"{variable_value}")
+        # Update the tooltip if the variable is still hovered
+        if is_current:
+            self._update_variable_tooltip(hover.name, value)
 
     def _update_variable_tooltip(self, variable_name: str, value: str) -> None:
         """Update the tooltip with the actual variable value."""
         # Update the source viewer with the variable value and update tooltip
         self.source_viewer.update_variable_tooltip(variable_name, value)
 
+    def _on_watchpoints_changed(self) -> None:
+        """Refresh the watchpoints tree unless a bulk change will refresh it once."""
+        if not self.breakpoint_manager.in_bulk():
+            self._update_watchpoints_tree()
+
     def _update_watchpoints_tree(self) -> None:
         """Update the watchpoints tree with current watchpoints."""
-        self.watchpoints_tree.clear()
         watchpoints = self.breakpoint_manager.get_watchpoints()
-        for wp in watchpoints:
-            item = QTreeWidgetItem(self.watchpoints_tree)
-            item.setText(0, wp.expression)
-            item.setText(1, wp.watch_type)
-            item.setText(2, "Yes" if wp.enabled else "No")
-            # Store watchpoint ID in the item
-            item.setData(0, Qt.UserRole, wp.watchpoint_id)
+        rows = [(wp.expression, wp.watch_type, "Yes" if wp.enabled else "No")
+                for wp in watchpoints]
+        # Store watchpoint ID with each row
+        row_data = [wp.watchpoint_id for wp in watchpoints]
+
+        # Swap all rows in with a single model reset
+        with _updates_suspended(self.watchpoints_tree):
+            self.watchpoints_model.set_rows(rows, row_data)
 
     def _update_registers_tree(self) -> None:
         """Update the registers tree with current register values."""
-        self.registers_tree.clear()
-        # Get register names
-        registers = self.gdb_controller.get_registers()
+        # Register names are fetched once per program; only values change between stops
+        if not self._register_layout:
+            self._register_layout = self.gdb_controller.get_registers()
+        registers = self._register_layout
         # Get register values in selected format
-        values = self.gdb_controller.get_register_values(self.register_format)
+        values = self.gdb_controller.get_register_values(
+            _MI_REGISTER_FORMATS.get(self.register_format, self.register_format))
 
         # Create a mapping of register number to value for quick lookup
         value_map = {v.get('number', ''): v.get('value', '') for v in values}
 
-        # Track current values for change detection
-        current_values = {}
-
+        rows = []
         for reg in registers:
-            item = QTreeWidgetItem(self.registers_tree)
-            register_name = reg.get('name', '')
             register_number = reg.get('number', '')
-            register_value = value_map.get(register_number, 'N/A')
-
-            item.setText(0, register_name)
-            item.setText(1, register_number)
-            item.setText(2, register_value)
+            rows.append((reg.get('name', ''), register_number, value_map.get(register_number, 'N/A')))
 
-            # Store current value for change detection
-            current_values[register_name] = register_value
+        # Highlight registers that changed since the last update (not
+        # registers seen for the first time)
+        current_values = {name: value for name, _, value in rows}
+        previous_values = self.previous_register_values
+        changed = [previous_values.get(name, value) != value for name, _, value in rows]
 
-            # Apply color highlighting for changed registers
-            if register_name in self.previous_register_values:
-                previous_value = self.previous_register_values[register_name]
-                if previous_value != register_value:
-                    # Register changed - highlight in yellow
-                    item.setBackground(2, Qt.yellow)
-                else:
-                    # Register unchanged - clear highlighting
-                    item.setBackground(2, Qt.transparent)
-            else:
-                # First time seeing this register
-                item.setBackground(2, Qt.transparent)
+        # The register set rarely changes between stops, so only rows whose
+        # values changed are updated; otherwise all rows are swapped in with
+        # a single model reset
+        if not self.registers_model.update_rows(rows, highlighted=changed):
+            with _updates_suspended(self.registers_tree):
+                self.registers_model.set_rows(rows, highlighted=changed)
 
         # Update previous values for next comparison
         self.previous_register_values = current_values
 
     def _update_variables_tree(self) -> None:
-        """Update the variables tree with current variable values."""
-        self.variables_tree.clear()
-        # Get variables from GDB
-        variables = self.gdb_controller.get_variables()
-
+        """Request current variable values; the tree is filled when GDB replies."""
+        self._gdb_worker.submit('variables', self.gdb_controller.get_variables)
+
+    def _handle_worker_reply(self, request: str, result: Any) -> None:
+        """
+        Handle the result of a request run on a worker thread.
+
+        Args:
+            request: Name the request was submitted with
+            result: Return value of the request
+        """
+        if request == 'variables':
+            self._populate_variables_tree(result)
+        elif request == 'output':
+            if result:
+                self._append_gdb_output_text(result)
+        elif request == 'initial_source':
+            self._on_initial_source_found(*result)
+        elif request == 'variable_children':
+            self._on_variable_children_loaded(*result)
+
+    def _handle_worker_failure(self, request: str, message: str) -> None:
+        """
+        Report a request that raised an exception on a worker thread.
+
+        Args:
+            request: Name the request was submitted with
+            message: Error message of the exception
+        """
+        self._show_error(f"Request '{request}' failed: {message}")
+
+    def _populate_variables_tree(self, variables: list) -> None:
+        """
+        Fill the variables tree.
+
+        Args:
+            variables: Variables returned by GDBController.get_variables
+        """
+        # Variable objects from the previous stop refer to a stale frame
+        for varobj_name in self._variable_objects:
+            self.gdb_controller.delete_variable_object(varobj_name)
+        self._variable_objects = []
+
+        rows = []
+        row_data = []
+        expandable = []
         for var in variables:
-            item = QTreeWidgetItem(self.variables_tree)
             name = var.get('name', 'N/A')
             value = var.get('value', '')
             var_type = var.get('type', 'N/A')
 
-            item.setText(0, name)
+            # Aggregates get an expand arrow; their children are fetched only when expanded
+            expandable.append('[' in var_type or value.startswith('{') or
+                              var_type.startswith(('struct ', 'union ', 'class ')))
+            row_data.append({'expression': name, 'varobj': None})
 
             # Handle empty values (e.g., arrays, structures)
             if not value:
@@ -969,23 +1414,84 @@ class MainWindow(QMainWindow):
                     # For arrays, show address if available, otherwise just "array"
                     addr = var.get('addr', '')
                     if addr:
-                        item.setText(1, f"array @ {addr}")
+                        value = f"array @ {addr}"
                     else:
-                        item.setText(1, "array")
+                        value = "array"
                 else:
                     # For other types with no value, show type
-                    item.setText(1, var_type)
-            else:
-                item.setText(1, value)
-
-            item.setText(2, var_type)
+                    value = var_type
+
+            rows.append((name, value, var_type))
+
+        # Swap all rows in with a single model reset
+        with _updates_suspended(self.variables_tree):
+            self.variables_model.set_rows(rows, row_data, expandable)
+
+    def _load_variable_children(self, node_data: dict, deliver: Callable) -> None:
+        """
+        Request the children of an expanded variable; they are delivered when GDB replies.
+
+        Args:
+            node_data: Row data holding the expression and, once created, the variable object name
+            deliver: Callback of the tree model receiving the children
+        """
+        self._gdb_worker.submit('variable_children', _query_variable_children,
+                                self.gdb_controller, node_data, deliver)
+
+    def _on_variable_children_loaded(self, node_data: dict, deliver: Callable,
+                                     varobj_name: Optional[str], gdb_children: list) -> None:
+        """
+        Deliver the children of an expanded variable to the variables model.
+
+        Args:
+            node_data: Row data of the expanded variable
+            deliver: Callback of the tree model receiving the children
+            varobj_name: Name of the variable object, or None if it could not be created
+            gdb_children: Children listed by GDB
+        """
+        if varobj_name is not None and node_data.get('varobj') is None:
+            # Tracked even if the tree was refreshed meanwhile, so it is deleted
+            node_data['varobj'] = varobj_name
+            self._variable_objects.append(varobj_name)
+
+        children = []
+        for child in gdb_children:
+            # --simple-values omits the value of aggregate children
+            values = (child.get('exp', ''), child.get('value', '{...}'), child.get('type', ''))
+            children.append((values, {'varobj': child.get('name')}, child.get('numchild', '0') != '0'))
+        deliver(children)
 
     def add_watchpoint_dialog(self) -> None:
         """Show dialog to add a new watchpoint."""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox, QPushButton, QMessageBox
-
+        self._show_watchpoint_dialog("Add Watchpoint", "Add", "", "write")
+
+    def _show_watchpoint_dialog(self, title: str, accept_text: str, expression: str,
+                                watch_type: str, watchpoint_id: Optional[int] = None) -> None:
+        """
+        Show the watchpoint dialog, shared by adding and editing watchpoints.
+
+        The dialog is built on first use and then reused with its inputs reset.
+
+        Args:
+            title: Window title
+            accept_text: Text of the accept button
+            expression: Initial expression
+            watch_type: Initial watchpoint type
+            watchpoint_id: ID of the watchpoint being edited, or None to add one
+        """
+        if self._watchpoint_dialog is None:
+            self._build_watchpoint_dialog()
+
+        self._watchpoint_dialog_target = watchpoint_id
+        self._watchpoint_dialog.setWindowTitle(title)
+        self._watchpoint_accept_button.setText(accept_text)
+        self._watchpoint_expression_input.setText(expression)
+        self._watchpoint_type_combo.setCurrentText(watch_type)
+        self._watchpoint_dialog.open()
+
+    def _build_watchpoint_dialog(self) -> None:
+        """Create the watchpoint dialog and keep references to its inputs."""
         dialog = QDialog(self)
-        dialog.setWindowTitle("Add Watchpoint")
         dialog.setModal(True)
 
         layout = QVBoxLayout(dialog)
@@ -993,9 +1499,9 @@ class MainWindow(QMainWindow):
         # Expression input
         expression_layout = QHBoxLayout()
         expression_label = QLabel("Expression:")
-        expression_label.setFont(QFont("Arial", 14))
+        expression_label.setFont(self._DIALOG_FONT)
         expression_input = QLineEdit()
-        expression_input.setFont(QFont("Arial", 14))
+        expression_input.setFont(self._DIALOG_FONT)
         expression_input.setPlaceholderText("e.g., variable_name, *0x1234")
         expression_layout.addWidget(expression_label)
         expression_layout.addWidget(expression_input)
@@ -1004,9 +1510,9 @@ class MainWindow(QMainWindow):
         # Type selection
         type_layout = QHBoxLayout()
         type_label = QLabel("Type:")
-        type_label.setFont(QFont("Arial", 14))
+        type_label.setFont(self._DIALOG_FONT)
         type_combo = QComboBox()
-        type_combo.setFont(QFont("Arial", 14))
+        type_combo.setFont(self._DIALOG_FONT)
         type_combo.addItems(["write", "read", "access"])
         type_layout.addWidget(type_label)
         type_layout.addWidget(type_combo)
@@ -1014,20 +1520,37 @@ class MainWindow(QMainWindow):
 
         # Buttons
         button_layout = QHBoxLayout()
-        add_button = QPushButton("Add")
-        add_button.setFont(QFont("Arial", 14))
+        accept_button = QPushButton()
+        accept_button.setFont(self._DIALOG_FONT)
         cancel_button = QPushButton("Cancel")
-        cancel_button.setFont(QFont("Arial", 14))
+        cancel_button.setFont(self._DIALOG_FONT)
 
-        add_button.clicked.connect(lambda: self._add_watchpoint_from_dialog(
-            expression_input.text(), type_combo.currentText(), dialog))
+        accept_button.clicked.connect(self._accept_watchpoint_dialog)
         cancel_button.clicked.connect(dialog.reject)
 
-        button_layout.addWidget(add_button)
+        button_layout.addWidget(accept_button)
         button_layout.addWidget(cancel_button)
         layout.addLayout(button_layout)
 
-        dialog.exec_()
+        self._watchpoint_dialog = dialog
+        self._watchpoint_expression_input = expression_input
+        self._watchpoint_type_combo = type_combo
+        self._watchpoint_accept_button = accept_button
+
+    def _accept_watchpoint_dialog(self) -> None:
+        """Add or update the watchpoint entered in the watchpoint dialog."""
+        expression = self._watchpoint_expression_input.text()
+        watch_type = self._watchpoint_type_combo.currentText()
+        watchpoint_id = self._watchpoint_dialog_target
+
+        if watchpoint_id is None:
+            self._add_watchpoint_from_dialog(expression, watch_type, self._watchpoint_dialog)
+            return
+
+        new_expression = expression.strip()
+        if new_expression and watch_type:
+            self.breakpoint_manager.update_watchpoint_expression(watchpoint_id, new_expression, watch_type)
+        self._watchpoint_dialog.accept()
 
     def _add_watchpoint_from_dialog(self, expression: str, watch_type: str, dialog: QDialog) -> None:
         """Add watchpoint from dialog input."""
@@ -1042,21 +1565,40 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to set watchpoint on '{expression}'")
 
     def load_initial_source(self, program_path: str) -> None:
+        """
+        Show the source file of a program.
+
+        A source file found before is shown immediately; otherwise it is
+        searched for on the file worker thread and shown when found.
+
+        Args:
+            program_path: Path to the program executable
+        """
         # For now, try to load the corresponding C file
         # In a real implementation, we would query GDB for the main file
-        c_file = program_path.replace('.exe', '.c')
-        if os.path.exists(c_file):
+        self._pending_initial_source = program_path
+        if program_path in self._initial_source_cache:
+            self._show_initial_source(self._initial_source_cache[program_path])
+        else:
+            self._file_worker.submit('initial_source', _find_initial_source, program_path)
+
+    def _on_initial_source_found(self, program_path: str, c_file: Optional[str]) -> None:
+        """
+        Cache the source file found for a program and show it if still wanted.
+
+        Args:
+            program_path: Path to the program executable
+            c_file: Path of the source file, or None if no C file was found
+        """
+        self._initial_source_cache[program_path] = c_file
+        if program_path == self._pending_initial_source:
+            self._show_initial_source(c_file)
+
+    def _show_initial_source(self, c_file: Optional[str]) -> None:
+        """Load the initial source file into the source viewer."""
+        if c_file:
             self.source_viewer.load_source_file(c_file)
             self.current_file_label.setText(f"Loaded: {c_file}")
-        else:
-            # Try to find any .c file in the same directory
-            directory = os.path.dirname(program_path)
-            for file in os.listdir(directory):
-                if file.endswith('.c'):
-                    c_file = os.path.join(directory, file)
-                    self.source_viewer.load_source_file(c_file)
-                    self.current_file_label.setText(f"Loaded: {c_file}")
-                    break
 
     def open_program(self) -> None:
         """Open a program for debugging."""
@@ -1082,12 +1624,9 @@ class MainWindow(QMainWindow):
         if hasattr(self.source_viewer, 'current_file'):
             current_file = self.source_viewer.current_file
             if current_file:
-                # Find breakpoint at this location
-                breakpoints = self.breakpoint_manager.get_breakpoints_in_file(current_file)
-                for bp in breakpoints:
-                    if bp.line == line_number:
-                        self.breakpoint_manager.remove_breakpoint(bp.breakpoint_id)
-                        break
+                bp = self.breakpoint_manager.get_breakpoint_at(current_file, line_number)
+                if bp:
+                    self.breakpoint_manager.remove_breakpoint(bp.breakpoint_id)
 
     def execute_gdb_command(self) -> None:
         """Execute a GDB command from the input field."""
@@ -1111,12 +1650,7 @@ class MainWindow(QMainWindow):
             current_file = self.source_viewer.current_file
 
             # Check if breakpoint already exists at this location
-            existing_bp = None
-            breakpoints = self.breakpoint_manager.get_breakpoints_in_file(current_file)
-            for bp in breakpoints:
-                if bp.line == line_number:
-                    existing_bp = bp
-                    break
+            existing_bp = self.breakpoint_manager.get_breakpoint_at(current_file, line_number)
 
             if existing_bp:
                 # Remove existing breakpoint
@@ -1136,61 +1670,92 @@ class MainWindow(QMainWindow):
         else:
             pass  # Cannot set breakpoint: no source file loaded
 
+    def _queue_variable_hover(self, variable_name: str) -> None:
+        """Coalesce hover requests; only the most recent variable is queried."""
+        self._pending_hover_variable = variable_name
+        if not self._hover_query_timer.isActive():
+            self._hover_query_timer.start()
+
+    def _flush_variable_hover(self) -> None:
+        """Query GDB for the most recently hovered variable."""
+        variable_name = self._pending_hover_variable
+        if not variable_name:
+            return
+
+        # Defer the query until the program has stayed stopped for a while
+        stopped_for_ms = time.monotonic_ns() // 1_000_000 - self._stopped_since_ms
+        if stopped_for_ms < _STABLE_STOP_MS:
+            self._hover_query_timer.start(_STABLE_STOP_MS - stopped_for_ms)
+            return
+
+        self._pending_hover_variable = None
+        # Skip the query if the mouse has already left the identifier
+        if variable_name == self.source_viewer.current_hover_variable:
+            self.handle_variable_hover(variable_name)
+
     def handle_variable_hover(self, variable_name: str) -> None:
         """Handle variable hover and query GDB for variable value."""
+        # Keywords and other non-identifiers would only be rejected by GDB
+        if not is_variable_name(variable_name):
+            return
+
         # Only query variable values when program is stopped
         if self.gdb_controller.current_state['state'] != 'stopped':
             return
 
-        # Store the current hover variable
-        self.current_hover_variable = variable_name
+        # Store the current hover; replies to earlier hovers are stale
+        self._hover = hover = _HoverState(variable_name, self._stop_id)
 
-        # Query GDB for variable value
-        try:
-            # Send command to get variable value
-            command = f"print {variable_name}"
-            if self.gdb_controller.send_command(command):
-                # Track this query so we can extract the value from the output
-                self.pending_variable_queries[variable_name] = True
-        except Exception as e:
-            pass  # Silent error handling
+        # Values do not change while the program stays stopped; holding Ctrl
+        # queries GDB again (e.g. after memory was changed from the console)
+        cache_key = (hover.stop_id, variable_name)
+        force_refresh = bool(QApplication.keyboardModifiers() & Qt.ControlModifier)
+        if not force_refresh and cache_key in self._hover_cache:
+            self._hover_cache.move_to_end(cache_key)
+            self._update_variable_tooltip(variable_name, self._hover_cache[cache_key])
+            return
+
+        # A query for this variable during this stop is still waiting for its
+        # reply; it now answers this hover
+        if not force_refresh:
+            for token, pending in self._hover_futures.items():
+                if pending.name == variable_name and pending.stop_id == hover.stop_id:
+                    self._hover_futures[token] = hover
+                    return
+
+        # Query GDB for variable value; the reply is matched by its token
+        with suppress(Exception):  # Silent error handling
+            token = self.gdb_controller.send_mi_command(
+                f'-data-evaluate-expression "{variable_name}"')
+            if token is not None:
+                self._hover_futures[token] = hover
 
     def _show_gdb_output_context_menu(self, position: Any) -> None:
         """Show context menu for GDB output text area."""
-        menu = QMenu(self.gdb_output_text)
+        # The menu never changes, so it is built on first use and reused
+        if self._gdb_output_menu is None:
+            self._gdb_output_menu = QMenu(self.gdb_output_text)
 
-        # Add Clear action
-        clear_action = QAction("Clear", self.gdb_output_text)
-        clear_action.triggered.connect(self._clear_gdb_output)
-        menu.addAction(clear_action)
+            # Add Clear action
+            clear_action = QAction("Clear", self.gdb_output_text)
+            clear_action.triggered.connect(self.gdb_output_text.clear)
+            self._gdb_output_menu.addAction(clear_action)
 
         # Show the menu at the cursor position
-        menu.exec_(self.gdb_output_text.viewport().mapToGlobal(position))
-
-    def _clear_gdb_output(self) -> None:
-        """Clear the GDB output text area."""
-        self.gdb_output_text.clear()
+        self._gdb_output_menu.exec_(self.gdb_output_text.viewport().mapToGlobal(position))
 
     def _show_watchpoints_context_menu(self, position: Any) -> None:
         """Show context menu for watchpoints tree."""
-        item = self.watchpoints_tree.itemAt(position)
-        if not item:
+        index = self.watchpoints_tree.indexAt(position)
+        if not index.isValid():
             return
 
         menu = QMenu(self.watchpoints_tree)
 
-        # Get watchpoint ID from item data (stored in first column)
-        expression = item.text(0)
-        watchpoint_type = item.text(1)
-
-        # Find the watchpoint by expression and type
-        watchpoint_id = None
-        for wp_id, wp in self.breakpoint_manager.get_watchpoints().items():
-            if wp.expression == expression and wp.watch_type == watchpoint_type:
-                watchpoint_id = wp_id
-                break
-
-        if watchpoint_id is None:
+        # The watchpoint ID is stored with the row
+        watchpoint_id = index.data(Qt.UserRole)
+        watchpoint = self.breakpoint_manager.get_watchpoint(watchpoint_id)
+        if watchpoint is None:
             return
 
         # Edit action
@@ -1204,8 +1769,7 @@ class MainWindow(QMainWindow):
         menu.addAction(delete_action)
 
         # Toggle action
-        enabled = item.text(2) == "True"
-        toggle_text = "Disable" if enabled else "Enable"
+        toggle_text = "Disable" if watchpoint.enabled else "Enable"
         toggle_action = QAction(toggle_text, self.watchpoints_tree)
         toggle_action.triggered.connect(lambda: self._toggle_watchpoint(watchpoint_id))
         menu.addAction(toggle_action)
@@ -1219,52 +1783,8 @@ class MainWindow(QMainWindow):
         if not watchpoint:
             return
 
-        # Create dialog for editing
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Edit Watchpoint")
-        dialog.setModal(True)
-
-        layout = QVBoxLayout(dialog)
-
-        # Expression input
-        expr_label = QLabel("Expression:")
-        layout.addWidget(expr_label)
-        expr_input = QLineEdit(dialog)
-        expr_input.setText(watchpoint.expression)
-        layout.addWidget(expr_input)
-
-        # Type selection
-        type_label = QLabel("Type:")
-        layout.addWidget(type_label)
-        type_combo = QComboBox(dialog)
-        type_combo.addItems(["write", "read", "access"])
-        type_combo.setCurrentText(watchpoint.watch_type)
-        layout.addWidget(type_combo)
-
-        # Buttons
-        button_layout = QHBoxLayout()
-        ok_button = QPushButton("OK", dialog)
-        cancel_button = QPushButton("Cancel", dialog)
-        button_layout.addWidget(ok_button)
-        button_layout.addWidget(cancel_button)
-        layout.addLayout(button_layout)
-
-        def on_ok():
-            new_expr = expr_input.text().strip()
-            new_type = type_combo.currentText()
-            if new_expr and new_type:
-                self.breakpoint_manager.update_watchpoint_expression(
-                    watchpoint_id, new_expr, new_type
-                )
-            dialog.accept()
-
-        def on_cancel():
-            dialog.reject()
-
-        ok_button.clicked.connect(on_ok)
-        cancel_button.clicked.connect(on_cancel)
-
-        dialog.exec_()
+        self._show_watchpoint_dialog("Edit Watchpoint", "OK", watchpoint.expression,
+                                     watchpoint.watch_type, watchpoint_id)
 
     def _delete_watchpoint(self, watchpoint_id: int) -> None:
         """Delete a watchpoint."""
@@ -1276,55 +1796,39 @@ class MainWindow(QMainWindow):
 
     def _show_registers_context_menu(self, position: Any) -> None:
         """Show context menu for registers tree."""
-        item = self.registers_tree.itemAt(position)
-        if not item:
+        index = self.registers_tree.indexAt(position)
+        if not index.isValid():
             return
 
         menu = QMenu(self.registers_tree)
 
-        # Get register name from item
-        register_name = item.text(0)
+        # Get register name and number from the row
+        register_name, register_number, register_value = self.registers_model.row_values(index.row())
 
         # Copy value action
         copy_value_action = QAction("Copy Value", self.registers_tree)
-        copy_value_action.triggered.connect(lambda: self._copy_register_value(register_name))
+        copy_value_action.triggered.connect(lambda: self._copy_text(register_value))
         menu.addAction(copy_value_action)
 
         # Copy name action
         copy_name_action = QAction("Copy Name", self.registers_tree)
-        copy_name_action.triggered.connect(lambda: self._copy_register_name(register_name))
+        copy_name_action.triggered.connect(lambda: self._copy_text(register_name))
         menu.addAction(copy_name_action)
 
         # Copy number action
         copy_number_action = QAction("Copy Number", self.registers_tree)
-        copy_number_action.triggered.connect(lambda: self._copy_register_number(item.text(1)))
+        copy_number_action.triggered.connect(lambda: self._copy_text(register_number))
         menu.addAction(copy_number_action)
 
         # Show the menu at the cursor position
         menu.exec_(self.registers_tree.viewport().mapToGlobal(position))
 
-    def _copy_register_value(self, register_name: str) -> None:
-        """Copy register value to clipboard."""
-        from PyQt5.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(register_name)
-
-    def _copy_register_name(self, register_name: str) -> None:
-        """Copy register name to clipboard."""
-        from PyQt5.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(register_name)
-
-    def _copy_register_number(self, register_number: str) -> None:
-        """Copy register number to clipboard."""
-        from PyQt5.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(register_number)
+    def _copy_text(self, text: str) -> None:
+        """Copy text to the clipboard."""
+        QApplication.clipboard().setText(text)
 
     def save_breakpoints(self) -> None:
         """Save breakpoints and watchpoints to a file."""
-        from PyQt5.QtWidgets import QFileDialog
-
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Breakpoints",
@@ -1340,8 +1844,6 @@ class MainWindow(QMainWindow):
 
     def load_breakpoints(self) -> None:
         """Load breakpoints and watchpoints from a file."""
-        from PyQt5.QtWidgets import QFileDialog
-
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Load Breakpoints",
@@ -1351,10 +1853,8 @@ class MainWindow(QMainWindow):
 
         if file_path:
             if self.breakpoint_manager.load_breakpoints_from_file(file_path):
+                # The watchpoints tree was refreshed once by bulk_changed
                 self.status_label.setText(f"Breakpoints loaded from {file_path}")
-                # Update UI
-                self._update_watchpoints_tree()
-                # Note: Breakpoints tree update is handled via signals
             else:
                 self.status_label.setText("Failed to load breakpoints")
 
@@ -1364,18 +1864,16 @@ class MainWindow(QMainWindow):
             self.status_label.setText("No GDB controller")
             return
 
-        state = self.gdb_controller.current_state['state']
+        current_state = self.gdb_controller.current_state
+        state = current_state['state']
 
         # Only react if program is running or stopped (being debugged)
-        if state in ['running', 'stopped']:
+        if state in ('running', 'stopped'):
             if self.gdb_controller.kill():
                 self.status_label.setText("Program killed")
                 # Update state to exited
-                self.gdb_controller.current_state['state'] = 'exited'
-                self.gdb_controller.current_state['line'] = None
-                self.gdb_controller.current_state['file'] = None
-                self.gdb_controller.current_state['function'] = None
-                self.gdb_controller.state_changed.emit(self.gdb_controller.current_state.copy())
+                current_state.update(state='exited', line=None, file=None, function=None)
+                self.gdb_controller.state_changed.emit(current_state.copy())
             else:
                 self.status_label.setText("Failed to kill program")
         elif state == 'exited':
@@ -1383,4 +1881,11 @@ class MainWindow(QMainWindow):
         elif state == 'disconnected':
             self.status_label.setText("No active debugging session")
         else:
-            self.status_label.setText(f"No program running (state: {state})")
\ No newline at end of file
+            self.status_label.setText(f"No program running (state: {state})")
+
+    def closeEvent(self, event) -> None:
+        """Stop the worker threads when the window is closed."""
+        self._gdb_worker.stop()
+        self._output_worker.stop()
+        self._file_worker.stop()
+        super().closeEvent(event)
@@ -4,11 +4,22 @@ Memory viewer for displaying and analyzing memory contents.
 
 from typing import List, Optional, Tuple, Dict, Any
 import math
+import struct
 from collections import Counter
 from PyQt5.QtCore import QObject, pyqtSignal
 from ..gdb.exceptions import GDBError, MemoryAccessError
 
 
+# Bytes shown per hex dump line, in groups of four
+_HEX_DUMP_LINE_BYTES = 16
+
+# Maps each byte to itself if printable ASCII, otherwise to '.'
+_HEX_DUMP_ASCII = bytes(b if 32 <= b <= 126 else ord('.') for b in range(256))
+
+# Little-endian unpackers for the common word sizes, read straight from the region data
+_WORD_STRUCTS = {2: struct.Struct('<H'), 4: struct.Struct('<I'), 8: struct.Struct('<Q')}
+
+
 class MemoryRegion:
     """
     Represents a region of memory.
@@ -17,7 +28,7 @@ class MemoryRegion:
     def __init__(self, address: int, size: int, data: bytes, permissions: str = "rwx"):
         self.address = address
         self.size = size
-        self.data = data
+        self.data = bytearray(data)  # Mutable, so writes update it in place
         self.permissions = permissions
 
     def get_byte(self, offset: int) -> Optional[int]:
@@ -46,6 +57,9 @@ class MemoryRegion:
             Word value or None if out of bounds
         """
         if 0 <= offset < len(self.data) - word_size + 1:
+            word_struct = _WORD_STRUCTS.get(word_size)
+            if word_struct is not None:
+                return word_struct.unpack_from(self.data, offset)[0]
             word_bytes = self.data[offset:offset + word_size]
             return int.from_bytes(word_bytes, byteorder='little')
         return None
@@ -114,9 +128,7 @@ class MemoryViewer(QObject):
                 offset = address - self.current_region.address
                 if offset + len(data) <= self.current_region.size:
                     # Update the region data
-                    new_data = bytearray(self.current_region.data)
-                    new_data[offset:offset + len(data)] = data
-                    self.current_region.data = bytes(new_data)
+                    self.current_region.data[offset:offset + len(data)] = data
                     self.memory_updated.emit(self.current_region)
                     return True
 
@@ -151,11 +163,16 @@ class MemoryViewer(QObject):
 
             if search_start < search_end:
                 data = self.current_region.data
-                pattern_len = len(pattern)
+                position = search_start - region_start
+                stop = search_end - region_start
 
-                for i in range(search_start - region_start, search_end - region_start - pattern_len + 1):
-                    if data[i:i + pattern_len] == pattern:
-                        addresses.append(region_start + i)
+                # Overlapping matches are reported, so each search resumes one byte on
+                while True:
+                    index = data.find(pattern, position, stop)
+                    if index < 0:
+                        break
+                    addresses.append(region_start + index)
+                    position = index + 1
 
         return addresses
 
@@ -175,40 +192,19 @@ class MemoryViewer(QObject):
             return ["Failed to read memory"]
 
         lines = []
-        bytes_per_line = 16
-
-        for i in range(0, size, bytes_per_line):
-            # Address
-            line = f"{address + i:08x}: "
-
-            # Hex bytes
-            hex_bytes = []
-            ascii_chars = []
-
-            for j in range(bytes_per_line):
-                if i + j < size:
-                    byte_val = region.get_byte(i + j)
-                    if byte_val is not None:
-                        hex_bytes.append(f"{byte_val:02x}")
-                        # ASCII representation
-                        if 32 <= byte_val <= 126:
-                            ascii_chars.append(chr(byte_val))
-                        else:
-                            ascii_chars.append(".")
-                    else:
-                        hex_bytes.append("  ")
-                        ascii_chars.append(" ")
-                else:
-                    hex_bytes.append("  ")
-                    ascii_chars.append(" ")
-
-            # Format hex bytes in groups
-            hex_line = ""
-            for k in range(0, bytes_per_line, 4):
-                hex_line += " ".join(hex_bytes[k:k+4]) + "  "
-
-            line += f"{hex_line:<50} |{''.join(ascii_chars)}|"
-            lines.append(line)
+        data = region.data
+
+        for i in range(0, size, _HEX_DUMP_LINE_BYTES):
+            chunk = data[i:min(i + _HEX_DUMP_LINE_BYTES, size)]
+
+            # Bytes missing at the end of the dump are shown as blanks
+            hex_text = chunk.hex(' ').ljust(3 * _HEX_DUMP_LINE_BYTES - 1)
+            ascii_text = chunk.translate(_HEX_DUMP_ASCII).decode('ascii')
+
+            # Hex bytes in groups of four, separated by two spaces
+            hex_line = f"{hex_text[0:11]}  {hex_text[12:23]}  {hex_text[24:35]}  {hex_text[36:47]}  "
+
+            lines.append(f"{address + i:08x}: {hex_line:<50} |{ascii_text:<{_HEX_DUMP_LINE_BYTES}}|")
 
         return lines
 
@@ -270,61 +266,53 @@ class MemoryViewer(QObject):
             return {}
 
         data = region.data  # bytes object
+        total = len(data)
+
+        # Every statistic is derived from one histogram of the byte values
+        counts = Counter(data)
+        zero_bytes = counts[0]
 
         analysis = {
-            'size': len(data),
-            'zero_bytes': sum(1 for b in data if b == 0),
-            'non_zero_bytes': sum(1 for b in data if b != 0),
-            'average_value': sum(data) / len(data) if data else 0.0,
-            'entropy': self._calculate_entropy(data),
-            'common_values': self._find_common_values(data),
+            'size': total,
+            'zero_bytes': zero_bytes,
+            'non_zero_bytes': total - zero_bytes,
+            'average_value': sum(value * count for value, count in counts.items()) / total if total else 0.0,
+            'entropy': self._calculate_entropy(counts, total),
+            'common_values': self._find_common_values(counts),
         }
 
         return analysis
 
-    def _calculate_entropy(self, data: bytes) -> float:
+    def _calculate_entropy(self, counts: Counter, total: int) -> float:
         """
         Calculate entropy of data.
 
         Args:
-            data: Bytes object
+            counts: Number of occurrences of each byte value
+            total: Number of bytes in the data
 
         Returns:
             Entropy value
         """
-        if not data:
+        if not total:
             return 0.0
 
-        # Count frequency of each byte value (0-255)
-        value_counts = [0] * 256
-        for b in data:
-            value_counts[b] += 1
-
         entropy = 0.0
-        total = len(data)
-        for count in value_counts:
-            if count > 0:
-                probability = count / total
-                entropy -= probability * math.log2(probability)
+        for count in counts.values():
+            probability = count / total
+            entropy -= probability * math.log2(probability)
 
         return entropy
 
-    def _find_common_values(self, data: bytes, top_n: int = 10) -> List[Tuple[int, int]]:
+    def _find_common_values(self, counts: Counter, top_n: int = 10) -> List[Tuple[int, int]]:
         """
         Find most common byte values.
 
         Args:
-            data: Bytes object
+            counts: Number of occurrences of each byte value
             top_n: Number of top values to return
 
         Returns:
             List of tuples (value, count)
         """
-        if not data:
-            return []
-
-        # Use Counter to count byte frequencies
-        counter = Counter(data)
-        # Get most common values
-        common = counter.most_common(top_n)
-        return common
\ No newline at end of file
+        return counts.most_common(top_n)
@@ -2,6 +2,9 @@
 Source code viewer with syntax highlighting.
 """
 
+import re
+from typing import Optional
+
 from PyQt5.QtWidgets import QPlainTextEdit, QTextEdit, QToolTip
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QPoint, QRectF
 from PyQt5.QtGui import QFont, QTextCursor, QColor, QTextCharFormat, QMouseEvent
@@ -21,6 +24,43 @@ except ImportError:
     PYGMENTS_AVAILABLE = False
 
 
+# Time the mouse must rest on an identifier before its value is queried
+_HOVER_DWELL_MS = 2000
+
+# C/C++ identifier: starts with a letter or underscore
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# Identifiers that are never variables
+_NON_VARIABLE_WORDS = frozenset({
+    # C keywords
+    'auto', 'break', 'case', 'char', 'const', 'continue', 'default', 'do', 'double',
+    'else', 'enum', 'extern', 'float', 'for', 'goto', 'if', 'int', 'long', 'register',
+    'return', 'short', 'signed', 'sizeof', 'static', 'struct', 'switch', 'typedef',
+    'union', 'unsigned', 'void', 'volatile', 'while',
+    # C++ keywords (common subset)
+    'bool', 'catch', 'class', 'const_cast', 'delete', 'dynamic_cast', 'explicit',
+    'false', 'friend', 'inline', 'mutable', 'namespace', 'new', 'operator',
+    'private', 'protected', 'public', 'reinterpret_cast', 'static_cast', 'template',
+    'this', 'throw', 'true', 'try', 'typeid', 'typename', 'using', 'virtual',
+    # Common library functions (to reduce false positives)
+    'printf', 'scanf', 'malloc', 'free', 'calloc', 'realloc', 'sizeof', 'strlen',
+    'strcpy', 'strcmp', 'fopen', 'fclose', 'fread', 'fwrite', 'main', 'exit'
+})
+
+
+def is_variable_name(text: str) -> bool:
+    """
+    Check if text could be a valid variable name.
+
+    Args:
+        text: Text to check
+
+    Returns:
+        bool: True if text is an identifier that is not a keyword or common library function
+    """
+    return _IDENTIFIER_RE.fullmatch(text) is not None and text not in _NON_VARIABLE_WORDS
+
+
 class SourceViewer(QTextEdit):
     """
     Source code viewer with basic syntax highlighting.
@@ -29,6 +69,7 @@ class SourceViewer(QTextEdit):
     current_line_changed = pyqtSignal(int)
     breakpoint_toggled = pyqtSignal(int)  # line_number
     variable_hovered = pyqtSignal(str)  # variable_name
+    file_loaded = pyqtSignal(str)  # file_path
 
     def __init__(self):
         super().__init__()
@@ -76,9 +117,6 @@ class SourceViewer(QTextEdit):
             # Fallback to textChanged signal
             self.textChanged.connect(self.update_line_number_area_width)
 
-        # Connect scroll bar value change to update line number area
-        self.verticalScrollBar().valueChanged.connect(self._handle_scroll_for_line_numbers)
-
         # Connect line number area click signal
         self.line_number_area.line_number_clicked.connect(self.toggle_breakpoint)
 
@@ -133,6 +171,7 @@ class SourceViewer(QTextEdit):
                 source_code = f.read()
 
             self.current_file = file_path
+            self.file_loaded.emit(file_path)
 
             if PYGMENTS_AVAILABLE:
                 # Use pygments for syntax highlighting
@@ -307,6 +346,26 @@ class SourceViewer(QTextEdit):
 
         return 'text'  # Default to plain text
 
+    def _line_cursor(self, line_number: int) -> Optional[QTextCursor]:
+        """
+        Get a cursor selecting a whole line.
+
+        Lines are never wrapped, so each line is one block of the document
+        and is looked up directly instead of moving a cursor down to it.
+
+        Args:
+            line_number: 1-based line number
+
+        Returns:
+            QTextCursor selecting the line, or None if the line does not exist
+        """
+        block = self.document().findBlockByNumber(line_number - 1)
+        if not block.isValid():
+            return None
+        cursor = QTextCursor(block)
+        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+        return cursor
+
     def highlight_current_line(self, line_number: int):
         """
         Highlight the current execution line.
@@ -328,17 +387,10 @@ class SourceViewer(QTextEdit):
         highlight_format = QTextCharFormat()
         highlight_format.setBackground(QColor(255, 255, 200))  # Light yellow
 
-        # Apply highlight
-        cursor = QTextCursor(self.document())
-        cursor.movePosition(QTextCursor.Start)
-
-        # Move to the target line
-        for _ in range(line_number - 1):
-            cursor.movePosition(QTextCursor.Down)
-
-        # Select the entire line
-        cursor.movePosition(QTextCursor.StartOfLine)
-        cursor.movePosition(QTextCursor.EndOfLine, QTextCursor.KeepAnchor)
+        # Apply highlight to the entire line
+        cursor = self._line_cursor(line_number)
+        if cursor is None:
+            return
 
         # Apply formatting
         cursor.setCharFormat(highlight_format)
@@ -347,11 +399,7 @@ class SourceViewer(QTextEdit):
         self.highlighted_lines[line_number] = highlight_format
 
         # Move cursor to the line and scroll to make it visible
-        scroll_cursor = QTextCursor(self.document())
-        scroll_cursor.movePosition(QTextCursor.Start)
-        for _ in range(line_number - 1):
-            scroll_cursor.movePosition(QTextCursor.Down)
-        scroll_cursor.movePosition(QTextCursor.StartOfLine)
+        scroll_cursor = QTextCursor(cursor.block())
         self.setTextCursor(scroll_cursor)
         self.ensureCursorVisible()
 
@@ -366,20 +414,10 @@ class SourceViewer(QTextEdit):
             line_number: Line number to clear
         """
         if line_number in self.highlighted_lines:
-            cursor = QTextCursor(self.document())
-            cursor.movePosition(QTextCursor.Start)
-
-            # Move to the target line
-            for _ in range(line_number - 1):
-                cursor.movePosition(QTextCursor.Down)
-
-            # Select the entire line
-            cursor.movePosition(QTextCursor.StartOfLine)
-            cursor.movePosition(QTextCursor.EndOfLine, QTextCursor.KeepAnchor)
-
-            # Clear formatting
-            default_format = QTextCharFormat()
-            cursor.setCharFormat(default_format)
+            cursor = self._line_cursor(line_number)
+            if cursor is not None:
+                # Clear formatting
+                cursor.setCharFormat(QTextCharFormat())
 
             del self.highlighted_lines[line_number]
 
@@ -405,21 +443,7 @@ class SourceViewer(QTextEdit):
         Returns:
             str: Content of the current line
         """
-        if self.current_line <= 0:
-            return ""
-
-        cursor = QTextCursor(self.document())
-        cursor.movePosition(QTextCursor.Start)
-
-        # Move to the target line
-        for _ in range(self.current_line - 1):
-            cursor.movePosition(QTextCursor.Down)
-
-        # Select the entire line
-        cursor.movePosition(QTextCursor.StartOfLine)
-        cursor.movePosition(QTextCursor.EndOfLine, QTextCursor.KeepAnchor)
-
-        return cursor.selectedText()
+        return self.get_line_content(self.current_line)
 
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse clicks for breakpoint setting."""
@@ -484,29 +508,47 @@ class SourceViewer(QTextEdit):
         cursor.select(QTextCursor.WordUnderCursor)
         variable_name = cursor.selectedText().strip()
 
-        # Stop any existing hover timer
-        if self.hover_timer_active:
-            self.hover_timer.stop()
-            self.hover_timer_active = False
-
         # Check if we're over a valid variable name
         if variable_name and self._is_valid_variable_name(variable_name):
-            # Store variable name and mouse position for later use
-            self.current_hover_variable = variable_name
             self.last_hover_pos = event.globalPos()
 
-            # Start 2-second delay timer
-            self.hover_timer.start(2000)  # 2000 milliseconds = 2 seconds
-            self.hover_timer_active = True
+            # Moving within the identifier that is already pending or shown
+            # neither restarts the dwell time nor queries it again
+            if variable_name != self.current_hover_variable:
+                self.current_hover_variable = variable_name
+
+                # Query only once the mouse has rested on the identifier
+                self.hover_timer.start(_HOVER_DWELL_MS)
+                self.hover_timer_active = True
         else:
+            # Stop any pending hover query
+            if self.hover_timer_active:
+                self.hover_timer.stop()
+                self.hover_timer_active = False
+
             # Hide tooltip if not over a valid variable
             QToolTip.hideText()
             self.current_hover_variable = None
 
         super().mouseMoveEvent(event)
 
+    def leaveEvent(self, event):
+        """Cancel a pending hover query when the mouse leaves the viewer."""
+        # Otherwise the dwell timer would still fire for the last identifier
+        # crossed on the way out and query a value nobody is looking at
+        if self.hover_timer_active:
+            self.hover_timer.stop()
+            self.hover_timer_active = False
+        self.current_hover_variable = None
+        super().leaveEvent(event)
+
     def _handle_hover_timeout(self):
         """Handle hover timer timeout - query variable value after delay."""
+        # No tooltip can be shown while another window is active or the mouse
+        # has left the viewer, so do not query GDB for one
+        if not (self.isActiveWindow() and self.underMouse()):
+            return
+
         if self.current_hover_variable and self.last_hover_pos:
             # Emit signal for variable hover (this triggers GDB query)
             self.variable_hovered.emit(self.current_hover_variable)
@@ -526,39 +568,7 @@ class SourceViewer(QTextEdit):
         Returns:
             bool: True if text could be a valid variable name
         """
-        # Basic variable name validation
-        if not text:
-            return False
-
-        # Check if it's a valid identifier (starts with letter/underscore, followed by alphanumeric/underscore)
-        if not text[0].isalpha() and text[0] != '_':
-            return False
-
-        # Check remaining characters
-        for char in text[1:]:
-            if not (char.isalnum() or char == '_'):
-                return False
-
-        # Avoid C/C++ keywords and common library functions
-        keywords = {
-            # C keywords
-            'auto', 'break', 'case', 'char', 'const', 'continue', 'default', 'do', 'double',
-            'else', 'enum', 'extern', 'float', 'for', 'goto', 'if', 'int', 'long', 'register',
-            'return', 'short', 'signed', 'sizeof', 'static', 'struct', 'switch', 'typedef',
-            'union', 'unsigned', 'void', 'volatile', 'while',
-            # C++ keywords (common subset)
-            'bool', 'catch', 'class', 'const_cast', 'delete', 'dynamic_cast', 'explicit',
-            'false', 'friend', 'inline', 'mutable', 'namespace', 'new', 'operator',
-            'private', 'protected', 'public', 'reinterpret_cast', 'static_cast', 'template',
-            'this', 'throw', 'true', 'try', 'typeid', 'typename', 'using', 'virtual',
-            # Common library functions (to reduce false positives)
-            'printf', 'scanf', 'malloc', 'free', 'calloc', 'realloc', 'sizeof', 'strlen',
-            'strcpy', 'strcmp', 'fopen', 'fclose', 'fread', 'fwrite', 'main', 'exit'
-        }
-        if text in keywords:
-            return False
-
-        return True
+        return is_variable_name(text)
 
     def get_line_content(self, line_number: int) -> str:
         """
@@ -573,18 +583,8 @@ class SourceViewer(QTextEdit):
         if line_number <= 0:
             return ""
 
-        cursor = QTextCursor(self.document())
-        cursor.movePosition(QTextCursor.Start)
-
-        # Move to the target line
-        for _ in range(line_number - 1):
-            cursor.movePosition(QTextCursor.Down)
-
-        # Select the entire line
-        cursor.movePosition(QTextCursor.StartOfLine)
-        cursor.movePosition(QTextCursor.EndOfLine, QTextCursor.KeepAnchor)
-
-        return cursor.selectedText()
+        cursor = self._line_cursor(line_number)
+        return cursor.selectedText() if cursor is not None else ""
 
     def is_code_line(self, line_number: int) -> bool:
         """
@@ -645,14 +645,18 @@ class SourceViewer(QTextEdit):
 
     def add_breakpoint_marker(self, line_number: int):
         """Add visual breakpoint marker."""
+        # GDB announces a breakpoint on every hit; a placed marker needs no repaint
+        if line_number in self.breakpoint_lines:
+            return
         self.breakpoint_lines.add(line_number)
         # Trigger repaint of line number area
         self.line_number_area.update()
 
     def remove_breakpoint_marker(self, line_number: int):
         """Remove visual breakpoint marker."""
-        if line_number in self.breakpoint_lines:
-            self.breakpoint_lines.remove(line_number)
+        if line_number not in self.breakpoint_lines:
+            return
+        self.breakpoint_lines.remove(line_number)
         # Trigger repaint of line number area
         self.line_number_area.update()
 
@@ -746,23 +750,17 @@ class SourceViewer(QTextEdit):
             width, cr.height()
         )
 
-    def update_line_number_area(self, rect, dy):
-        """Update the line number area."""
-        # Debug: print update info
-        # print(f"update_line_number_area: dy={dy}")
-        # Always trigger a full repaint of the line number area
-        # The scroll() method doesn't work well with custom painted content
-        self.line_number_area.update()
+    def update_line_number_area(self, dy):
+        """
+        Scroll the line number area along with the content.
 
-        if rect.contains(self.viewport().rect()):
-            self.update_line_number_area_width(0)
+        The already painted numbers are blitted and Qt repaints only the
+        newly exposed strip.
 
-    def _handle_scroll_for_line_numbers(self):
-        """Handle scroll bar value change to update line number area."""
-        # Debug: print scroll value
-        # print(f"scroll value={self.verticalScrollBar().value()}")
-        # Call update_line_number_area with dy=0 (full repaint)
-        self.update_line_number_area(self.viewport().rect(), 0)
+        Args:
+            dy: Vertical scroll amount in pixels
+        """
+        self.line_number_area.scroll(0, dy)
 
     def resizeEvent(self, event):
         """Handle resize events."""
@@ -775,12 +773,9 @@ class SourceViewer(QTextEdit):
 
     def scrollContentsBy(self, dx, dy):
         """Override scrollContentsBy to update line number area."""
-        # Debug: only print if significant scroll
-        # if abs(dy) > 10:
-        #     print(f"scrollContentsBy: dy={dy}")
         super().scrollContentsBy(dx, dy)
 
-        # Update line number area with the scrolled amount
+        # Horizontal scrolling does not move line numbers
         # dy is the vertical scroll amount in pixels
-        # update_line_number_area expects dy for scrolling the line number area
-        self.update_line_number_area(self.viewport().rect(), dy)
\ No newline at end of file
+        if dy:
+            self.update_line_number_area(dy)
\ No newline at end of file
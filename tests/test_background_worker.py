@@ -0,0 +1,48 @@
+"""
+Tests for the background worker thread.
+"""
+
+import sys
+import os
+import threading
+
+# Add the parent directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ddd_clone.gui.background_worker import BackgroundWorker
+
+
+def test_submit_runs_call_on_worker_thread(qtbot):
+    """Test a submitted call runs off the GUI thread and its result is delivered."""
+    worker = BackgroundWorker()
+    calls = []
+
+    def query(value):
+        calls.append(threading.current_thread())
+        return value * 2
+
+    try:
+        with qtbot.waitSignal(worker.reply, timeout=2000) as blocker:
+            worker.submit('double', query, 21)
+
+        assert blocker.args == ['double', 42]
+        assert calls[0] is not threading.main_thread()
+    finally:
+        worker.stop()
+    assert not worker.is_running()
+
+
+def test_submit_reports_failure(qtbot):
+    """Test an exception raised by a submitted call is reported."""
+    worker = BackgroundWorker()
+
+    def query():
+        raise RuntimeError("GDB process not running")
+
+    try:
+        with qtbot.waitSignal(worker.failed, timeout=2000) as blocker:
+            worker.submit('variables', query)
+
+        assert blocker.args == ['variables', "GDB process not running"]
+    finally:
+        worker.stop()
@@ -2,6 +2,8 @@
 Unit tests for breakpoint manager.
 """
 
+import json
+import tempfile
 import unittest
 from unittest.mock import Mock
 import sys
@@ -190,6 +192,18 @@ class TestBreakpointManager(unittest.TestCase):
         self.assertIn(bp2, breakpoints)
         self.assertNotIn(bp3, breakpoints)
 
+    def test_get_breakpoint_at(self):
+        """Test looking up a breakpoint by file and line."""
+        bp = self.manager.add_breakpoint("test.c", 10)
+
+        self.assertIs(self.manager.get_breakpoint_at("test.c", 10), bp)
+        self.assertIsNone(self.manager.get_breakpoint_at("test.c", 11))
+        self.assertIsNone(self.manager.get_breakpoint_at("other.c", 10))
+
+        # Removed breakpoints are no longer found
+        self.manager.remove_breakpoint(bp.breakpoint_id)
+        self.assertIsNone(self.manager.get_breakpoint_at("test.c", 10))
+
     def test_clear_all_breakpoints(self):
         """Test clearing all breakpoints."""
         # Add multiple breakpoints
@@ -204,6 +218,28 @@ class TestBreakpointManager(unittest.TestCase):
         # GDB delete should be called twice
         self.assertEqual(self.mock_gdb.delete_breakpoint.call_count, 2)
 
+    def test_load_from_file_is_one_bulk_change(self):
+        """Test loading a file reports one bulk change after all entries are applied."""
+        data = {
+            'breakpoints': [{'id': 1, 'file': 'test.c', 'line': 10, 'condition': None, 'enabled': True}],
+            'watchpoints': [{'id': i, 'expression': f'var{i}', 'type': 'write', 'enabled': True}
+                            for i in range(1, 4)],
+        }
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump(data, f)
+        self.addCleanup(os.remove, f.name)
+
+        bulk_flags = []
+        bulk_changes = []
+        self.manager.watchpoint_added.connect(lambda wp: bulk_flags.append(self.manager.in_bulk()))
+        self.manager.bulk_changed.connect(lambda: bulk_changes.append(len(self.manager.watchpoints)))
+
+        self.assertTrue(self.manager.load_breakpoints_from_file(f.name))
+        self.assertEqual(bulk_flags, [True, True, True])
+        self.assertEqual(bulk_changes, [3])
+        self.assertFalse(self.manager.in_bulk())
+        self.assertIsNotNone(self.manager.get_breakpoint_at('test.c', 10))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
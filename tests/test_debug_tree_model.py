@@ -0,0 +1,196 @@
+"""
+Unit tests for debug tree model.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the parent directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt5.QtCore import Qt, QModelIndex
+from PyQt5.QtGui import QBrush
+from PyQt5.QtWidgets import QApplication, QTreeView
+
+from ddd_clone.gui.debug_tree_model import DebugTreeModel, FixedRowDelegate, LOADING_TEXT
+
+
+class TestDebugTreeModel(unittest.TestCase):
+    """Test cases for DebugTreeModel class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.model = DebugTreeModel(["Name", "Value", "Type"])
+
+    def test_initial_state(self):
+        """Test initial state of the model."""
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertEqual(self.model.columnCount(), 3)
+        self.assertEqual(self.model.headerData(1, Qt.Horizontal), "Value")
+
+    def test_set_rows(self):
+        """Test replacing all rows."""
+        self.model.set_rows([("x", "1", "int"), ("y", "2.5", "double")])
+
+        self.assertEqual(self.model.rowCount(), 2)
+        index = self.model.index(1, 1)
+        self.assertEqual(self.model.data(index), "2.5")
+        self.assertEqual(self.model.row_values(0), ("x", "1", "int"))
+
+        # Rows are flat, so no index exists below a row
+        self.assertFalse(self.model.index(0, 0, self.model.index(0, 0)).isValid())
+        self.assertEqual(self.model.rowCount(self.model.index(0, 0)), 0)
+        self.assertEqual(self.model.parent(index), QModelIndex())
+
+    def test_row_data(self):
+        """Test user data stored per row."""
+        self.model.set_rows([("x", "1", "int")], row_data=[42])
+        self.assertEqual(self.model.data(self.model.index(0, 0), Qt.UserRole), 42)
+
+    def test_append_row_and_clear(self):
+        """Test appending a row and clearing the model."""
+        self.model.append_row(("x", "1", "int"))
+        self.model.append_row(("y", "2", "int"), row_data="extra")
+
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual(self.model.data(self.model.index(1, 2)), "int")
+        self.assertEqual(self.model.data(self.model.index(1, 0), Qt.UserRole), "extra")
+
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+
+    def test_highlighted_rows(self):
+        """Test the highlight column of highlighted rows has a background."""
+        brush = QBrush(Qt.yellow)
+        self.model.set_highlight(1, brush)
+        self.model.set_rows([("x", "1", "int"), ("y", "2", "int")], highlighted=[False, True])
+
+        self.assertIsNone(self.model.data(self.model.index(0, 1), Qt.BackgroundRole))
+        self.assertEqual(self.model.data(self.model.index(1, 1), Qt.BackgroundRole), brush)
+        self.assertIsNone(self.model.data(self.model.index(1, 0), Qt.BackgroundRole))
+
+    def test_update_rows_in_place(self):
+        """Test only changed rows are reported when rows are updated in place."""
+        self.model.set_rows([("x", "1", "int"), ("y", "2", "int")], row_data=["x_data", "y_data"])
+        changed_rows = []
+        self.model.dataChanged.connect(lambda top_left, bottom_right: changed_rows.append(top_left.row()))
+        resets = []
+        self.model.modelReset.connect(lambda: resets.append(True))
+
+        self.assertTrue(self.model.update_rows([("x", "1", "int"), ("y", "3", "int")]))
+        self.assertEqual(changed_rows, [1])
+        self.assertEqual(resets, [])
+        self.assertEqual(self.model.row_values(1), ("y", "3", "int"))
+        self.assertEqual(self.model.data(self.model.index(1, 0), Qt.UserRole), "y_data")
+
+        # A different number of rows is left to set_rows
+        self.assertFalse(self.model.update_rows([("x", "1", "int")]))
+        self.assertEqual(self.model.rowCount(), 2)
+
+    def test_invalid_index(self):
+        """Test invalid indexes return no data."""
+        self.assertIsNone(self.model.data(QModelIndex()))
+        self.assertFalse(self.model.index(5, 0).isValid())
+
+
+class TestDebugTreeModelLazyChildren(unittest.TestCase):
+    """Test cases for lazily loaded children in DebugTreeModel."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.model = DebugTreeModel(["Name", "Value", "Type"])
+        self.loader_calls = []
+        self.children = [(("[0]", "1", "int"), "child0", False),
+                         (("[1]", "{...}", "struct point"), "child1", True)]
+
+        # Children are delivered later, as the GDB worker does
+        def loader(data, deliver):
+            self.loader_calls.append((data, deliver))
+
+        self.model.set_children_loader(loader)
+        self.model.set_rows([("arr", "{1, 2}", "int [2]"), ("x", "1", "int")],
+                            row_data=["arr_data", "x_data"],
+                            expandable=[True, False])
+
+    def test_has_children_without_loading(self):
+        """Test expandable rows report children before loading them."""
+        arr_index = self.model.index(0, 0)
+        x_index = self.model.index(1, 0)
+
+        self.assertTrue(self.model.hasChildren(arr_index))
+        self.assertEqual(self.model.rowCount(arr_index), 0)
+        self.assertFalse(self.model.hasChildren(x_index))
+        self.assertTrue(self.model.canFetchMore(arr_index))
+        self.assertFalse(self.model.canFetchMore(x_index))
+        self.assertFalse(self.model.canFetchMore(QModelIndex()))
+        self.assertEqual(self.loader_calls, [])
+
+    def test_fetch_more_inserts_placeholder_then_children(self):
+        """Test fetching children shows a placeholder until they are loaded."""
+        arr_index = self.model.index(0, 0)
+        self.model.fetchMore(arr_index)
+
+        # Placeholder row until the loader delivers the children
+        self.assertEqual(self.model.rowCount(arr_index), 1)
+        self.assertEqual(self.model.data(self.model.index(0, 0, arr_index)), LOADING_TEXT)
+        self.assertFalse(self.model.canFetchMore(arr_index))
+
+        self.assertEqual([data for data, _ in self.loader_calls], ["arr_data"])
+        deliver = self.loader_calls[0][1]
+        deliver(self.children)
+
+        self.assertEqual(self.model.rowCount(arr_index), 2)
+        child_index = self.model.index(1, 0, arr_index)
+        self.assertEqual(self.model.data(self.model.index(1, 2, arr_index)), "struct point")
+        self.assertEqual(self.model.data(child_index, Qt.UserRole), "child1")
+        self.assertEqual(self.model.parent(child_index).row(), 0)
+        self.assertTrue(self.model.canFetchMore(child_index))
+
+    def test_load_after_reset_is_dropped(self):
+        """Test children delivered for rows discarded by a reset are dropped."""
+        arr_index = self.model.index(0, 0)
+        arr_node = arr_index.internalPointer()
+        self.model.fetchMore(arr_index)
+        deliver = self.loader_calls[0][1]
+
+        self.model.set_rows([("y", "2", "int")])
+        deliver(self.children)
+
+        self.assertEqual(self.model.rowCount(), 1)
+        self.assertEqual([child.values for child in arr_node.children], [(LOADING_TEXT,)])
+
+    def test_rows_are_stored_on_nodes(self):
+        """Test each node knows its row, so parent lookups need no search."""
+        self.model.append_row(("z", "3", "int"))
+        rows = [self.model.index(row, 0).internalPointer().row for row in range(3)]
+        self.assertEqual(rows, [0, 1, 2])
+
+
+class TestFixedRowDelegate(unittest.TestCase):
+    """Test cases for FixedRowDelegate class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the application required by widgets."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_rows_share_first_height(self):
+        """Test every row reports the height measured for the first one."""
+        model = DebugTreeModel(["Name", "Value"])
+        model.set_rows([("x", "1"), ("long_name", "{1, 2, 3}")])
+        view = QTreeView()
+        view.setModel(model)
+        delegate = FixedRowDelegate(view)
+        view.setItemDelegate(delegate)
+
+        option = view.viewOptions()
+        first = delegate.sizeHint(option, model.index(0, 0))
+        second = delegate.sizeHint(option, model.index(1, 1))
+
+        self.assertGreater(first.height(), 0)
+        self.assertEqual(first, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
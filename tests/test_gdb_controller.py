@@ -6,6 +6,8 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
+import time
+import queue
 
 # Add the parent directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -78,6 +80,86 @@ class TestGDBController(unittest.TestCase):
         self.assertTrue(result)
         mock_process.stdin.write.assert_called_once_with("test_command\n")
 
+    @patch('subprocess.Popen')
+    def test_async_send(self, mock_popen):
+        """Test queued commands are written by the write thread."""
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+        mock_process.stdin = Mock()
+        mock_popen.return_value = mock_process
+
+        # Nothing is queued without a GDB process
+        self.assertFalse(self.controller.async_send("test_command"))
+
+        self.controller.start_gdb("test_program")
+        self.assertTrue(self.controller.async_send("test_command"))
+
+        deadline = time.time() + 5
+        while not mock_process.stdin.write.called and time.time() < deadline:
+            time.sleep(0.01)
+        mock_process.stdin.write.assert_called_once_with("test_command\n")
+
+        # The write thread exits on shutdown
+        write_thread = self.controller.write_thread
+        self.controller.shutdown()
+        write_thread.join(timeout=5)
+        self.assertFalse(write_thread.is_alive())
+
+    def test_write_commands_batches_queued_commands(self):
+        """Test commands queued together are written with one call."""
+        self.controller._write_stdin = Mock(return_value=True)
+        process = Mock()
+        process.poll.return_value = None
+        write_queue = queue.SimpleQueue()
+        write_queue.put("1-data-evaluate-expression \"a\"")
+        write_queue.put("2-data-evaluate-expression \"b\"")
+        write_queue.put(None)
+
+        self.controller._write_commands(process, write_queue)
+
+        self.controller._write_stdin.assert_called_once_with(
+            process, "1-data-evaluate-expression \"a\"\n2-data-evaluate-expression \"b\"")
+
+    @patch('subprocess.Popen')
+    def test_start_gdb_stops_previous_write_thread(self, mock_popen):
+        """Test a new session does not share its write queue with the old writer."""
+        old_process = Mock()
+        old_process.poll.return_value = None
+        new_process = Mock()
+        new_process.poll.return_value = None
+        mock_popen.side_effect = [old_process, new_process]
+
+        self.controller.start_gdb("test_program")
+        old_thread = self.controller.write_thread
+        old_queue = self.controller._write_queue
+
+        self.controller.start_gdb("test_program")
+        old_thread.join(timeout=5)
+        self.assertFalse(old_thread.is_alive())
+        self.assertIsNot(self.controller._write_queue, old_queue)
+
+        self.assertTrue(self.controller.async_send("test_command"))
+        deadline = time.time() + 5
+        while not new_process.stdin.write.called and time.time() < deadline:
+            time.sleep(0.01)
+        new_process.stdin.write.assert_called_once_with("test_command\n")
+        old_process.stdin.write.assert_not_called()
+        self.controller.shutdown()
+
+    def test_send_mi_command(self):
+        """Test MI commands are tagged with unique tokens."""
+        self.controller.async_send = Mock(return_value=True)
+
+        first = self.controller.send_mi_command("-data-evaluate-expression x")
+        second = self.controller.send_mi_command("-data-evaluate-expression y")
+
+        self.assertNotEqual(first, second)
+        self.controller.async_send.assert_called_with(f"{second}-data-evaluate-expression y")
+
+        # No token is returned if the command was not queued
+        self.controller.async_send.return_value = False
+        self.assertIsNone(self.controller.send_mi_command("-data-evaluate-expression z"))
+
     def test_debug_commands(self):
         """Test debug command methods."""
         # Mock send_command
@@ -233,6 +315,79 @@ class TestGDBController(unittest.TestCase):
         result = self.controller.evaluate_expression("x")
         self.assertIsNone(result)
 
+    def test_read_output_batches_lines(self):
+        """Test output read from GDB is processed and emitted in batches."""
+        read_fd, write_fd = os.pipe()
+        self.controller.gdb_process = Mock()
+        self.controller.gdb_process.poll.return_value = None
+        self.controller.gdb_process.stdout.fileno.return_value = read_fd
+
+        batches = []
+        self.controller.output_batch_received.connect(batches.append)
+
+        os.write(write_fd, b'~"first"\n*running,thread-id="all"\n(gdb)\n~"par')
+        os.write(write_fd, b'tial"\r\n')
+        os.close(write_fd)
+        try:
+            self.controller._read_output()
+        finally:
+            os.close(read_fd)
+
+        lines = [line for batch in batches for line in batch]
+        self.assertEqual(lines, ['~"first"\n', '*running,thread-id="all"\n', '(gdb)\n', '~"partial"\n'])
+        self.assertEqual(self.controller.output_queue.qsize(), 4)
+        self.assertEqual(self.controller.current_state['state'], 'running')
+
+    @patch.object(GDBController, 'send_mi_command_sync')
+    def test_create_variable_object(self, mock_send_mi):
+        """Test creating a GDB variable object."""
+        mock_send_mi.return_value = ('^', 'done,name="var1",numchild="2",value="{...}",type="struct point",has_more="0"')
+        self.controller.gdb_process = Mock()
+        self.controller.gdb_process.poll.return_value = None
+
+        varobj = self.controller.create_variable_object("pt")
+        self.assertEqual(varobj['name'], 'var1')
+        self.assertEqual(varobj['numchild'], '2')
+        self.assertEqual(varobj['type'], 'struct point')
+        mock_send_mi.assert_called_with("-var-create - * pt")
+
+        # Error response
+        mock_send_mi.return_value = ('^', 'error,msg="No symbol \\"pt\\" in current context."')
+        self.assertIsNone(self.controller.create_variable_object("pt"))
+
+    @patch.object(GDBController, 'send_mi_command_sync')
+    def test_list_variable_children(self, mock_send_mi):
+        """Test listing children of a GDB variable object."""
+        mock_send_mi.return_value = (
+            '^',
+            'done,numchild="2",children=['
+            'child={name="var1.x",exp="x",numchild="0",value="1",type="int"},'
+            'child={name="var1.label",exp="label",numchild="0",value="0x4000 \\"a}b\\"",type="char *"}]'
+            ',has_more="0"'
+        )
+        self.controller.gdb_process = Mock()
+        self.controller.gdb_process.poll.return_value = None
+
+        children = self.controller.list_variable_children("var1")
+        self.assertEqual(len(children), 2)
+        self.assertEqual(children[0]['name'], 'var1.x')
+        self.assertEqual(children[0]['value'], '1')
+        self.assertEqual(children[1]['exp'], 'label')
+        self.assertEqual(children[1]['type'], 'char *')
+        mock_send_mi.assert_called_with("-var-list-children --simple-values var1")
+
+    def test_variable_objects_no_process(self):
+        """Test variable object queries when no GDB process."""
+        self.controller.gdb_process = None
+        self.assertIsNone(self.controller.create_variable_object("x"))
+        self.assertEqual(self.controller.list_variable_children("var1"), [])
+
+    def test_delete_variable_object(self):
+        """Test deleting a GDB variable object."""
+        self.controller.send_command = Mock(return_value=True)
+        self.assertTrue(self.controller.delete_variable_object("var1"))
+        self.controller.send_command.assert_called_with("-var-delete var1")
+
     @patch.object(GDBController, 'send_mi_command_sync')
     def test_read_memory(self, mock_send_mi):
         """Test reading memory."""
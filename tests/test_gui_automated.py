@@ -5,7 +5,7 @@ These tests run without manual intervention.
 
 import sys
 import os
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -103,6 +103,31 @@ def test_source_viewer_load(qtbot):
         # Skip the assertion if file doesn't exist
 
 
+def test_source_viewer_highlight_current_line(qtbot):
+    """Test the current line is highlighted, moved and read back by line number."""
+    from ddd_clone.gui.source_viewer import SourceViewer
+
+    viewer = SourceViewer()
+    qtbot.addWidget(viewer)
+    viewer.setPlainText("int a;\nint b = 2;\nint c;\n")
+
+    viewer.highlight_current_line(2)
+    assert viewer.current_line == 2
+    assert viewer.get_current_line_content() == "int b = 2;"
+    assert viewer.textCursor().blockNumber() == 1
+    line_format = viewer.document().findBlockByNumber(1).begin().fragment().charFormat()
+    assert line_format.background().color().getRgb()[:3] == (255, 255, 200)
+
+    # Moving the highlight clears the previous line
+    viewer.highlight_current_line(3)
+    assert list(viewer.highlighted_lines) == [3]
+    assert viewer.get_line_content(3) == "int c;"
+    assert viewer.document().findBlockByNumber(1).begin().fragment().charFormat().background().style() == Qt.NoBrush
+
+    # Lines past the end of the file have no content
+    assert viewer.get_line_content(10) == ""
+
+
 def test_memory_viewer_basics(qtbot):
     """Test basic MemoryViewer functionality."""
     from ddd_clone.gui.memory_viewer import MemoryViewer, MemoryRegion
@@ -131,6 +156,84 @@ def test_memory_viewer_basics(qtbot):
     # Test word access
     word = region.get_word(0, 4)
     assert word == 0x03020100  # Little endian: [0, 1, 2, 3] -> 0x03020100
+    assert region.get_word(14, 2) == 0x0f0e
+    assert region.get_word(8, 8) == 0x0f0e0d0c0b0a0908
+    assert region.get_word(1, 3) == 0x030201
+    assert region.get_word(13, 4) is None  # Runs past the end
+
+
+def test_memory_viewer_search(qtbot):
+    """Test MemoryViewer finds every occurrence of a pattern within the search range."""
+    from ddd_clone.gui.memory_viewer import MemoryViewer, MemoryRegion
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    viewer = MemoryViewer(Mock(spec=GDBController))
+    viewer.current_region = MemoryRegion(address=0x1000, size=8, data=b"\xaa\xaa\xaa\x00\xaa\xaa\x01\xaa")
+
+    # Overlapping matches are all reported
+    assert viewer.search_memory(b"\xaa\xaa") == [0x1000, 0x1001, 0x1004]
+
+    # Matches must lie entirely inside the search range
+    assert viewer.search_memory(b"\xaa\xaa", 0x1001, 0x1005) == [0x1001]
+    assert viewer.search_memory(b"\xaa", 0x2000) == []
+
+
+def test_memory_viewer_hex_dump(qtbot):
+    """Test MemoryViewer hex dump lines group bytes and pad the last line."""
+    from ddd_clone.gui.memory_viewer import MemoryViewer
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.read_memory.return_value = b"Hello, world!\x00\x01\x02ABC"
+    viewer = MemoryViewer(mock_gdb)
+
+    lines = viewer.hex_dump(0x1000, 19)
+    assert lines == [
+        "00001000: 48 65 6c 6c  6f 2c 20 77  6f 72 6c 64  21 00 01 02   |Hello, world!...|",
+        "00001010: 41 42 43                                             |ABC             |",
+    ]
+
+
+def test_memory_viewer_analyze_patterns(qtbot):
+    """Test MemoryViewer derives the region statistics from the byte values."""
+    from ddd_clone.gui.memory_viewer import MemoryViewer, MemoryRegion
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    viewer = MemoryViewer(Mock(spec=GDBController))
+    data = bytes([0, 0, 0, 0, 7, 7, 255, 255])
+    analysis = viewer.analyze_memory_patterns(MemoryRegion(address=0x1000, size=8, data=data))
+
+    assert analysis['size'] == 8
+    assert analysis['zero_bytes'] == 4
+    assert analysis['non_zero_bytes'] == 4
+    assert analysis['average_value'] == (7 * 2 + 255 * 2) / 8
+    assert analysis['entropy'] == 1.5
+    assert analysis['common_values'] == [(0, 4), (7, 2), (255, 2)]
+
+    empty = viewer.analyze_memory_patterns(MemoryRegion(address=0x1000, size=0, data=b""))
+    assert empty['entropy'] == 0.0
+    assert empty['common_values'] == []
+
+
+def test_memory_viewer_write_in_place(qtbot):
+    """Test MemoryViewer writes update the current region's data in place."""
+    from ddd_clone.gui.memory_viewer import MemoryViewer, MemoryRegion
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    viewer = MemoryViewer(Mock(spec=GDBController))
+    viewer.current_region = MemoryRegion(address=0x1000, size=8, data=bytes(8))
+    data = viewer.current_region.data
+    update_signals = []
+    viewer.memory_updated.connect(update_signals.append)
+
+    assert viewer.write_memory(0x1005, b"\xff\xee\xdd") is True
+    assert viewer.current_region.data is data
+    assert data == b"\x00\x00\x00\x00\x00\xff\xee\xdd"
+    assert update_signals == [viewer.current_region]
+
+    # Writes running past the end of the region are rejected
+    assert viewer.write_memory(0x1006, b"\x01\x02\x03") is False
+    assert data[6:] == b"\xee\xdd"
 
 
 def test_memory_viewer_read_write(qtbot):
@@ -206,6 +309,61 @@ def test_line_number_area_basics(qtbot):
         assert source_viewer.breakpoint_lines == {5, 10, 15}
 
 
+def test_line_number_area_paint_caches(qtbot):
+    """Test LineNumberArea caches line metrics and line number strings."""
+    from ddd_clone.gui.source_viewer import SourceViewer
+
+    viewer = SourceViewer()
+    qtbot.addWidget(viewer)
+    line_area = viewer.line_number_area
+
+    viewer.setPlainText("int a;\nint b;\nint c;\n")
+
+    # Uniform line height is measured lazily from the document layout
+    line_area._update_line_metrics()
+    assert line_area._line_metrics_valid
+    first_rect = viewer.blockBoundingGeometry(viewer.document().firstBlock())
+    assert line_area._fixed_line_height == first_rect.height()
+    assert line_area._fixed_line_stride >= line_area._fixed_line_height
+
+    # Any content change invalidates the cached metrics
+    viewer.setPlainText("int a;\n")
+    assert not line_area._line_metrics_valid
+
+    # Line number strings are built once and reused
+    assert line_area._num_str(12) == "12"
+    assert line_area._num_str(3) == "3"
+    assert line_area._num_str(12) is line_area._num_str(12)
+
+
+def test_line_number_area_scrolls_with_content(qtbot):
+    """Test vertical scrolling blits the line numbers instead of repainting them all."""
+    from ddd_clone.gui.source_viewer import SourceViewer
+
+    viewer = SourceViewer()
+    qtbot.addWidget(viewer)
+    viewer.resize(400, 200)
+    viewer.setPlainText('\n'.join(f"int v{i};" for i in range(200)))
+    viewer.show()
+    qtbot.waitExposed(viewer)
+
+    line_area = viewer.line_number_area
+    scroll_bar = viewer.verticalScrollBar()
+    with patch.object(line_area, 'scroll') as mock_scroll, \
+            patch.object(line_area, 'update') as mock_update:
+        scroll_bar.setValue(10)
+        assert mock_scroll.call_count == 1
+        dx, dy = mock_scroll.call_args[0]
+        assert dx == 0 and dy < 0
+        mock_update.assert_not_called()
+
+        # Horizontal scrolling leaves the line numbers alone
+        mock_scroll.reset_mock()
+        viewer.scrollContentsBy(5, 0)
+        mock_scroll.assert_not_called()
+        mock_update.assert_not_called()
+
+
 def test_breakpoint_manager_gui(qtbot):
     """Test BreakpointManager GUI integration."""
     from ddd_clone.gui.breakpoint_manager import BreakpointManager, Breakpoint
@@ -321,6 +479,564 @@ def test_main_window_advanced(qtbot):
     mock_gdb.send_command.assert_called_once_with("break main")
 
 
+def test_gdb_output_batching(qtbot):
+    """Test GDB output and variable hovers are coalesced before the UI is updated."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'disconnected'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+    window.gdb_output_text.clear()
+
+    # Output lines are buffered and appended in a single flush
+    window._queue_gdb_output("first line")
+    window._queue_gdb_output("second line")
+    assert window.gdb_output_text.toPlainText() == ""
+    qtbot.waitUntil(lambda: window.gdb_output_text.toPlainText() == "first line\nsecond line")
+    assert not window._pending_gdb_output
+
+    # A later batch starts on a new line; lines are cleaned on the output worker thread
+    window._queue_gdb_output_batch(['~"third line\\n"\n', '*running,thread-id="all"\n'])
+    qtbot.waitUntil(lambda: window.gdb_output_text.toPlainText() ==
+                    "first line\nsecond line\nthird line")
+    assert window._output_worker.is_running()
+
+    # The output area follows the newest line
+    window._append_gdb_output_text('\n'.join(f"line {i}" for i in range(200)))
+    scroll_bar = window.gdb_output_text.verticalScrollBar()
+    assert scroll_bar.value() == scroll_bar.maximum() > 0
+
+    # Only the last hovered variable is queried
+    with patch.object(window, 'handle_variable_hover') as mock_hover:
+        window.source_viewer.current_hover_variable = "b"
+        window._queue_variable_hover("a")
+        window._queue_variable_hover("b")
+        qtbot.waitUntil(lambda: mock_hover.called)
+        mock_hover.assert_called_once_with("b")
+
+        # Nothing is queried once the mouse has left the identifier
+        mock_hover.reset_mock()
+        window._queue_variable_hover("c")
+        window.source_viewer.current_hover_variable = None
+        qtbot.wait(300)
+        mock_hover.assert_not_called()
+
+        # Right after a stop the query waits until the stop is stable
+        mock_gdb.get_variables.return_value = []
+        window.update_ui_state({'state': 'stopped'})
+        window.source_viewer.current_hover_variable = "d"
+        window._queue_variable_hover("d")
+        qtbot.wait(150)
+        mock_hover.assert_not_called()
+        qtbot.waitUntil(lambda: mock_hover.called)
+        mock_hover.assert_called_once_with("d")
+
+
+def test_gdb_output_noise_filter(qtbot):
+    """Test cleaning and noise filtering of GDB console output."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'disconnected'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    # Banner, command echo and MI records are noise
+    assert window._clean_gdb_output('~"GNU gdb (GDB) 12.1\\n"') == ""
+    assert window._clean_gdb_output('~"print x\\n"') == ""
+    assert window._clean_gdb_output('~"1^done,value=\\"1\\""') == ""
+    assert window._clean_gdb_output('~"Reading symbols from a.out...\\n"') == ""
+
+    # Case-sensitive patterns only match their exact spelling
+    assert window._clean_gdb_output('~"reading symbols from a.out\\n"') == "reading symbols from a.out"
+
+    # Values, errors and source lines are kept
+    assert window._clean_gdb_output('~"$1 = \\"hi\\"\\n"') == "$1 = hi"
+    assert window._clean_gdb_output('^error,msg="No symbol table"') == "Error: No symbol table"
+
+    # Lines read from GDB keep their terminator; it does not hide the closing quote
+    assert window._clean_gdb_output('~"$3 = 7\\n"\n') == "$3 = 7"
+    assert window._clean_gdb_output('~"\x1b[31m$2 = 5\x1b[0m"') == "$2 = 5"
+
+
+def test_gdb_output_context_menu_reused(qtbot):
+    """Test the GDB output context menu is built once and reused."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+    from PyQt5.QtCore import QPoint
+    from PyQt5.QtWidgets import QMenu
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'disconnected'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    with patch.object(QMenu, 'exec_') as mock_exec:
+        window._show_gdb_output_context_menu(QPoint(0, 0))
+        menu = window._gdb_output_menu
+        window._show_gdb_output_context_menu(QPoint(5, 5))
+
+    assert mock_exec.call_count == 2
+    assert window._gdb_output_menu is menu
+    assert [action.text() for action in menu.actions()] == ["Clear"]
+
+    # The Clear action empties the output area
+    window.gdb_output_text.setPlainText("some output")
+    menu.actions()[0].trigger()
+    assert window.gdb_output_text.toPlainText() == ""
+
+
+def test_watchpoint_context_menu_uses_row_id(qtbot):
+    """Test the watchpoint context menu acts on the watchpoint stored with the row."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+    from PyQt5.QtCore import QPoint
+    from PyQt5.QtWidgets import QMenu
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'stopped'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+    mock_gdb.set_watchpoint.return_value = True
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+    window.breakpoint_manager.add_watchpoint("x")
+    watchpoint = window.breakpoint_manager.add_watchpoint("y", "read")
+
+    menus = []
+    second_row = window.watchpoints_model.index(1, 1)
+    with patch.object(window.watchpoints_tree, 'indexAt', return_value=second_row), \
+            patch.object(QMenu, 'exec_', lambda menu, *args: menus.append(menu)), \
+            patch.object(window, '_delete_watchpoint') as mock_delete:
+        window._show_watchpoints_context_menu(QPoint(0, 0))
+        delete_action = [action for action in menus[0].actions() if action.text() == "Delete"][0]
+        delete_action.trigger()
+
+    mock_delete.assert_called_once_with(watchpoint.watchpoint_id)
+
+    # The toggle action reflects the watchpoint's enabled state
+    assert [action.text() for action in menus[0].actions()] == ["Edit", "Delete", "Disable"]
+
+
+def test_register_context_menu_copies_row_values(qtbot):
+    """Test each register copy action puts its column of the row on the clipboard."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+    from PyQt5.QtCore import QPoint
+    from PyQt5.QtWidgets import QMenu
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'stopped'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+    window.registers_model.set_rows([("rax", "0", "0x2a")])
+
+    menus = []
+    with patch.object(window.registers_tree, 'indexAt', return_value=window.registers_model.index(0, 0)), \
+            patch.object(QMenu, 'exec_', lambda menu, *args: menus.append(menu)), \
+            patch.object(window, '_copy_text') as mock_copy:
+        window._show_registers_context_menu(QPoint(0, 0))
+        for action in menus[0].actions():
+            action.trigger()
+
+    assert [call.args[0] for call in mock_copy.call_args_list] == ["0x2a", "rax", "0"]
+
+
+def test_watchpoint_dialog_shared_by_add_and_edit(qtbot):
+    """Test adding and editing watchpoints reuse one dialog."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'stopped'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+    mock_gdb.set_watchpoint.return_value = True
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    window.add_watchpoint_dialog()
+    dialog = window._watchpoint_dialog
+    assert dialog.windowTitle() == "Add Watchpoint"
+    window._watchpoint_expression_input.setText("counter")
+    window._watchpoint_type_combo.setCurrentText("read")
+    window._watchpoint_accept_button.click()
+    assert not dialog.isVisible()
+    watchpoint = window.breakpoint_manager.get_watchpoints()[0]
+    assert (watchpoint.expression, watchpoint.watch_type) == ("counter", "read")
+
+    # Editing reuses the dialog, filled in with the watchpoint
+    with patch.object(window.breakpoint_manager, 'update_watchpoint_expression') as mock_update:
+        window._edit_watchpoint(watchpoint.watchpoint_id)
+        assert window._watchpoint_dialog is dialog
+        assert dialog.windowTitle() == "Edit Watchpoint"
+        assert window._watchpoint_expression_input.text() == "counter"
+        window._watchpoint_expression_input.setText("total")
+        window._watchpoint_accept_button.click()
+    mock_update.assert_called_once_with(watchpoint.watchpoint_id, "total", "read")
+
+
+def test_execution_errors_shown_in_status_bar(qtbot):
+    """Test execution errors are reported in the status bar without a message box."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'disconnected'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+    mock_gdb.step_over.side_effect = RuntimeError("GDB is busy")
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    with patch('ddd_clone.gui.main_window.QMessageBox') as mock_message_box:
+        window.step_over()
+
+    mock_message_box.critical.assert_not_called()
+    assert window.statusBar().currentMessage() == "Error: Failed to step over: GDB is busy"
+
+
+def test_run_or_continue_by_state(qtbot):
+    """Test the Run/Continue button runs or continues depending on the state."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'exited'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+    mock_gdb.gdb_process = Mock()
+    mock_gdb.gdb_process.poll.return_value = None
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    window.run_or_continue()
+    mock_gdb.run.assert_called_once()
+    mock_gdb.continue_execution.assert_not_called()
+
+    mock_gdb.current_state = {'state': 'stopped'}
+    window.run_or_continue()
+    mock_gdb.continue_execution.assert_called_once()
+
+    mock_gdb.current_state = {'state': 'running'}
+    window.run_or_continue()
+    assert mock_gdb.run.call_count == 1
+    assert mock_gdb.continue_execution.call_count == 1
+
+    mock_gdb.current_state = {'state': 'unknown'}
+    window.run_or_continue()
+    assert window.statusBar().currentMessage() == "Error: Cannot run/continue in state: unknown"
+
+
+def test_hidden_debug_panes_refresh_on_tab_change(qtbot):
+    """Test only the visible debug pane is refreshed when the program stops."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'disconnected'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    update_variables = Mock()
+    update_registers = Mock()
+    window._pane_updaters[window.variables_tree] = update_variables
+    window._pane_updaters[window.registers_tree] = update_registers
+
+    window.debug_tab_widget.setCurrentWidget(window.variables_tree)
+    window.update_ui_state({'state': 'stopped', 'file': 'test.c', 'line': 5})
+    update_variables.assert_called_once()
+    update_registers.assert_not_called()
+
+    # The deferred register refresh runs once when its tab is shown
+    window.debug_tab_widget.setCurrentWidget(window.registers_tree)
+    window.debug_tab_widget.setCurrentWidget(window.variables_tree)
+    window.debug_tab_widget.setCurrentWidget(window.registers_tree)
+    update_registers.assert_called_once()
+    update_variables.assert_called_once()
+
+
+def test_breakpoint_output_marks_current_file(qtbot):
+    """Test breakpoint output adds markers only for the file being shown."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'disconnected'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    test_file = os.path.join(os.path.dirname(__file__), '..', 'examples', 'simple_program.c')
+    window.source_viewer.load_source_file(test_file)
+    window.source_viewer.breakpoint_lines.clear()
+
+    window._handle_breakpoint_output("Breakpoint 1 at 0x401530: file /src/simple_program.c, line 5.")
+    window._handle_breakpoint_output("Breakpoint 2, main () at simple_program.c:7")
+    window._handle_breakpoint_output("Breakpoint 3 at 0x401540: file program.c, line 9.")
+    assert window.source_viewer.breakpoint_lines == {5, 7}
+
+    # Hitting a marked breakpoint again does not repaint the gutter
+    with patch.object(window.source_viewer.line_number_area, 'update') as mock_update:
+        window._handle_breakpoint_output("Breakpoint 2, main () at simple_program.c:7")
+    mock_update.assert_not_called()
+
+
+def test_load_initial_source(qtbot, tmp_path):
+    """Test the source file for a program is found on the file worker once and then cached."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'disconnected'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    (tmp_path / "notes.txt").write_text("not source")
+    source_file = tmp_path / "main.c"
+    source_file.write_text("int main(void) { return 0; }\n")
+    program_path = str(tmp_path / "program")
+    (tmp_path / "program").write_bytes(b"\x7fELF")
+
+    # A program without an extension is not mistaken for its own source
+    with qtbot.waitSignal(window._file_worker.reply, timeout=2000):
+        window.load_initial_source(program_path)
+    qtbot.waitUntil(lambda: window.source_viewer.current_file == str(source_file))
+
+    # A second load of the same program is shown at once without scanning again
+    window.source_viewer.current_file = None
+    with patch('os.scandir') as mock_scandir:
+        window.load_initial_source(program_path)
+        mock_scandir.assert_not_called()
+    assert window.source_viewer.current_file == str(source_file)
+
+    # A source file named after the program is preferred
+    named_source = tmp_path / "tool.c"
+    named_source.write_text("int main(void) { return 1; }\n")
+    window.load_initial_source(str(tmp_path / "tool.exe"))
+    qtbot.waitUntil(lambda: window.source_viewer.current_file == str(named_source))
+    window.close()
+
+
+def test_variables_fetched_on_worker_thread(qtbot):
+    """Test the variables pane is filled from a query run on the GDB worker thread."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'stopped'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+    mock_gdb.get_variables = Mock(return_value=[{'name': 'x', 'value': '5', 'type': 'int'}])
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    window._update_variables_tree()
+    qtbot.waitUntil(lambda: window.variables_model.rowCount() == 1)
+    assert window.variables_model.row_values(0) == ('x', '5', 'int')
+
+    window.close()
+    assert not window._gdb_worker.is_running()
+
+
+def test_variable_children_loaded_on_worker_thread(qtbot):
+    """Test expanding a variable queries its children off the GUI thread."""
+    import threading
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'stopped'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+    query_threads = []
+
+    def create_variable_object(expression):
+        query_threads.append(threading.current_thread())
+        return {'name': 'var1', 'numchild': '2'}
+
+    mock_gdb.create_variable_object = Mock(side_effect=create_variable_object)
+    mock_gdb.list_variable_children = Mock(return_value=[
+        {'name': 'var1.x', 'exp': 'x', 'numchild': '0', 'value': '1', 'type': 'int'},
+        {'name': 'var1.y', 'exp': 'y', 'numchild': '0', 'value': '2', 'type': 'int'}])
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+    window._populate_variables_tree([{'name': 'p', 'value': '{x = 1, y = 2}', 'type': 'struct point'}])
+
+    p_index = window.variables_model.index(0, 0)
+    window.variables_model.fetchMore(p_index)
+    qtbot.waitUntil(lambda: window.variables_model.rowCount(p_index) == 2)
+
+    assert window.variables_model.data(window.variables_model.index(1, 0, p_index)) == 'y'
+    assert query_threads[0] is not threading.main_thread()
+    mock_gdb.list_variable_children.assert_called_once_with('var1')
+    assert window._variable_objects == ['var1']
+    window.close()
+
+
+def test_worker_failure_shown_in_status_bar(qtbot):
+    """Test an exception raised by a worker request is reported to the user."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'stopped'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+    mock_gdb.get_variables = Mock(side_effect=RuntimeError("GDB went away"))
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    window._update_variables_tree()
+    qtbot.waitUntil(lambda: "GDB went away" in window.statusBar().currentMessage())
+    window.close()
+
+
+def test_hover_values_cached_per_stop(qtbot):
+    """Test a hovered variable is queried once per stop."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'stopped'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+    mock_gdb.send_mi_command = Mock(side_effect=[1, 2, 3])
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    with patch.object(window, '_update_variable_tooltip') as mock_tooltip:
+        window.handle_variable_hover("x")
+        mock_gdb.send_mi_command.assert_called_with('-data-evaluate-expression "x"')
+
+        # A second hover before the reply arrives does not send another query
+        window.handle_variable_hover("x")
+        assert mock_gdb.send_mi_command.call_count == 1
+
+        window._handle_variable_output('1^done,value="5"')
+        mock_tooltip.assert_called_with("x", "5")
+
+        # Hovering again during the same stop uses the cached value
+        window.handle_variable_hover("x")
+        assert mock_gdb.send_mi_command.call_count == 1
+        assert mock_tooltip.call_count == 2
+
+        # Holding Ctrl bypasses the cache
+        with patch('ddd_clone.gui.main_window.QApplication.keyboardModifiers',
+                   return_value=Qt.ControlModifier):
+            window.handle_variable_hover("x")
+        assert mock_gdb.send_mi_command.call_count == 2
+        window._handle_variable_output('2^done,value="6"')
+        mock_tooltip.assert_called_with("x", "6")
+
+        # Running the program invalidates the cached value
+        window.update_ui_state({'state': 'running'})
+        window.handle_variable_hover("x")
+        assert mock_gdb.send_mi_command.call_count == 3
+
+        # A query left unanswered when the program exits is dropped
+        assert window._hover_futures
+        window.update_ui_state({'state': 'exited'})
+        assert window._hover_futures == {}
+
+
+def test_hover_replies_matched_by_token(qtbot):
+    """Test hover replies are routed by token, not by the hovered variable."""
+    from ddd_clone.gui.main_window import MainWindow
+    from ddd_clone.gdb.gdb_controller import GDBController
+
+    mock_gdb = Mock(spec=GDBController)
+    mock_gdb.current_state = {'state': 'stopped'}
+    mock_gdb.state_changed = Mock()
+    mock_gdb.output_received = Mock()
+    mock_gdb.send_mi_command = Mock(side_effect=[7, 8])
+
+    window = MainWindow(mock_gdb)
+    qtbot.addWidget(window)
+
+    # Keywords and non-identifiers are never sent to GDB
+    window.handle_variable_hover("int")
+    window.handle_variable_hover("a->b")
+    mock_gdb.send_mi_command.assert_not_called()
+
+    with patch.object(window, '_update_variable_tooltip') as mock_tooltip:
+        window.handle_variable_hover("a")
+        window.handle_variable_hover("b")
+
+        # The reply for "a" arrives after the mouse moved on to "b"
+        window._handle_variable_output('7^done,value="1"')
+        mock_tooltip.assert_not_called()
+        assert window._hover_cache[(window._stop_id, "a")] == "1"
+
+        # Unknown tokens belong to other commands
+        window._handle_variable_output('99^done,value="3"')
+        mock_tooltip.assert_not_called()
+
+        window._handle_variable_output('8^done,value="2"')
+        mock_tooltip.assert_called_once_with("b", "2")
+        assert window._hover_futures == {}
+
+        # A late reply is not shown over the value of a newer hover
+        mock_gdb.send_mi_command.side_effect = [11, 12]
+        mock_tooltip.reset_mock()
+        window.handle_variable_hover("c")
+        window.handle_variable_hover("a")  # Cached
+        window._handle_variable_output('11^done,value="3"')
+        mock_tooltip.assert_called_once_with("a", "1")
+
+        # Hovering again while the query is pending adopts that query
+        window.handle_variable_hover("d")
+        window.handle_variable_hover("a")
+        window.handle_variable_hover("d")
+        assert mock_gdb.send_mi_command.call_count == 4
+        window._handle_variable_output('12^done,value="4"')
+        mock_tooltip.assert_called_with("d", "4")
+
+        # Escaped quotes in the MI value are removed like those of printed strings
+        mock_gdb.send_mi_command.side_effect = [9, 10]
+        window.handle_variable_hover("s")
+        window._handle_variable_output('9^done,value="0x4005d0 \\"hi\\""')
+        mock_tooltip.assert_called_with("s", "0x4005d0 hi")
+
+        # Failed queries hide the tooltip instead of showing a value
+        window.handle_variable_hover("q")
+        with patch('ddd_clone.gui.main_window.QToolTip.hideText') as mock_hide:
+            window._handle_variable_output('10^error,msg="No symbol \\"q\\" in current context."')
+        mock_hide.assert_called_once()
+        assert (window._stop_id, "q") not in window._hover_cache
+
+
 def test_demo_gui_functionality(qtbot):
     """Automated version of test_gui.py functionality."""
     from ddd_clone.gui.main_window import MainWindow
@@ -548,7 +1264,7 @@ def test_variable_name_validation(qtbot):
 def test_hover_timer_functionality(qtbot):
     """Test hover timer starts and stops correctly."""
     from ddd_clone.gui.source_viewer import SourceViewer
-    from PyQt5.QtCore import QPoint
+    from PyQt5.QtCore import QPoint, QEvent
     from PyQt5.QtGui import QMouseEvent
     from PyQt5.QtCore import Qt
     from unittest.mock import Mock, patch
@@ -605,6 +1321,14 @@ def test_hover_timer_functionality(qtbot):
         assert viewer.current_hover_variable == 'anotherVar'
         mock_super.assert_called_once_with(mock_event)
 
+        # Moving within the same identifier keeps the pending query running
+        with patch.object(viewer.hover_timer, 'start') as mock_start:
+            mock_event.globalPos.return_value = QPoint(205, 150)
+            viewer.mouseMoveEvent(mock_event)
+            mock_start.assert_not_called()
+        assert viewer.hover_timer.isActive() == True
+        assert viewer.last_hover_pos == QPoint(205, 150)
+
         # Reset mock for next call
         mock_super.reset_mock()
 
@@ -618,6 +1342,27 @@ def test_hover_timer_functionality(qtbot):
         assert viewer.hover_timer.isActive() == False
         mock_super.assert_called_once_with(mock_event)
 
+        # Leaving the viewer cancels a pending hover query
+        mock_cursor.selectedText.return_value = 'myVariable'
+        viewer.mouseMoveEvent(mock_event)
+        assert viewer.hover_timer.isActive() == True
+        with qtbot.assertNotEmitted(viewer.variable_hovered):
+            viewer.leaveEvent(QEvent(QEvent.Leave))
+            assert viewer.hover_timer.isActive() == False
+            assert viewer.current_hover_variable is None
+
+    # The value is only queried while the viewer's window is active and under the mouse
+    viewer.current_hover_variable = 'myVariable'
+    viewer.last_hover_pos = QPoint(200, 150)
+    with qtbot.assertNotEmitted(viewer.variable_hovered):
+        viewer._handle_hover_timeout()
+    with patch.object(viewer, 'isActiveWindow', return_value=True), \
+         patch.object(viewer, 'underMouse', return_value=True), \
+         patch('ddd_clone.gui.source_viewer.QToolTip.showText'):
+        with qtbot.waitSignal(viewer.variable_hovered, timeout=1000) as blocker:
+            viewer._handle_hover_timeout()
+    assert blocker.args == ['myVariable']
+
     # Restore original method
     viewer.cursorForPosition = original_cursorForPosition
 
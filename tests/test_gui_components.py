@@ -79,6 +79,17 @@ def test_register_format_change(qtbot):
     # Check format changed
     assert window.register_format == "b"
 
+    # GDB is asked for binary values with its own format letter
+    window._update_registers_tree()
+    mock_gdb.get_register_values.assert_called_with("t")
+
+    # Register names are queried once while the program is loaded
+    window._update_registers_tree()
+    mock_gdb.get_registers.assert_called_once()
+    window.update_ui_state({'state': 'exited'})
+    window._update_registers_tree()
+    assert mock_gdb.get_registers.call_count == 2
+
 
 def test_watchpoint_context_menu(qtbot):
     """Test watchpoint context menu creation."""
@@ -196,6 +207,13 @@ def test_register_change_highlighting(qtbot):
     assert 'rax' in window.previous_register_values
     assert window.previous_register_values['rax'] == '0x1001'
 
+    # Only the changed value is highlighted
+    model = window.registers_model
+    assert model.row_values(0) == ('rax', '0', '0x1001')
+    assert model.data(model.index(0, 2), Qt.BackgroundRole) is not None
+    assert model.data(model.index(1, 2), Qt.BackgroundRole) is None
+    assert model.data(model.index(0, 0), Qt.BackgroundRole) is None
+
 
 def test_syntax_highlight_dropdown_button(qtbot):
     """Test syntax highlighting dropdown button creation and interaction."""